@@ -0,0 +1,99 @@
+import argparse
+import io
+import os
+import string
+import time
+from typing import Callable, Tuple
+
+from oop2lab import ConsoleArtPrinter, FrameBuilder, SymbolPatterns, TextColor
+
+
+class CountingSink(io.RawIOBase):
+    """Сырой поток в /dev/null, считающий вызовы write (каждый - системный вызов) и байты"""
+
+    def __init__(self):
+        self._fd = os.open(os.devnull, os.O_WRONLY)
+        self.calls = 0
+        self.bytes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.calls += 1
+        self.bytes += len(data)
+        return os.write(self._fd, data)
+
+    def close(self) -> None:
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+
+def terminal_stream(sink: CountingSink) -> io.TextIOWrapper:
+    """Текстовый поток с построчной буферизацией, как sys.stdout у терминала"""
+    return io.TextIOWrapper(io.BufferedWriter(sink), encoding='utf-8', line_buffering=True)
+
+
+def make_font() -> SymbolPatterns:
+    """Синтетический шрифт 5x5 на все буквы и цифры"""
+    return SymbolPatterns({char: ['* * *', ' * * ', '*****', ' * * ', '* * *']
+                           for char in string.ascii_uppercase + string.digits})
+
+
+def legacy_render(printer: ConsoleArtPrinter, message: str, stream: io.TextIOWrapper) -> None:
+    """Прежний render_text: print на каждую строку с переходом курсора и цветом"""
+    base_y, base_x = printer.position
+    for line_num in range(5):
+        output_line = []
+        for char in message:
+            char_lines = printer.font.get_pattern(char)
+            if line_num < len(char_lines):
+                output_line.append(char_lines[line_num].replace('*', printer.fill_char))
+        if output_line:
+            print(f"\033[{base_y + line_num};{base_x}H{printer.color.value}{'  '.join(output_line)}", file=stream)
+
+
+def measure(frame: Callable[[io.TextIOWrapper], None], frames: int) -> Tuple[float, float, float]:
+    """Байты и системные вызовы на кадр, кадров в секунду"""
+    sink = CountingSink()
+    stream = terminal_stream(sink)
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame(stream)
+    stream.flush()
+    elapsed = time.perf_counter() - start
+    result = sink.bytes / frames, sink.calls / frames, frames / elapsed
+    stream.close()
+    return result
+
+
+def run_benchmark(banner_length: int, printers: int, frames: int) -> None:
+    font = make_font()
+    message = (string.ascii_uppercase * (banner_length // 26 + 1))[:banner_length]
+    banners = [ConsoleArtPrinter(TextColor.GREEN, (1 + 6 * i, 1), '#', font) for i in range(printers)]
+
+    def legacy(stream):
+        for printer in banners:
+            legacy_render(printer, message, stream)
+        print(TextColor.DEFAULT.value, end='', file=stream)
+
+    def single_write(stream):
+        with FrameBuilder(stream) as builder:
+            for printer in banners:
+                builder.add_text(printer, message)
+
+    print(f"Баннеров в кадре: {printers}, символов в баннере: {banner_length}")
+    print(f"{'method':<16}{'bytes/frame':>14}{'writes/frame':>14}{'frames/s':>12}")
+    for label, frame in (('print per row', legacy), ('FrameBuilder', single_write)):
+        size, calls, rate = measure(frame, frames)
+        print(f"{label:<16}{size:>14.0f}{calls:>14.1f}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Вывод баннеров: print построчно против одной записи на кадр")
+    parser.add_argument("--length", type=int, default=200, help="символов в баннере")
+    parser.add_argument("--printers", type=int, default=4, help="баннеров в кадре")
+    parser.add_argument("--frames", type=int, default=500)
+    args = parser.parse_args()
+    run_benchmark(args.length, args.printers, args.frames)
@@ -0,0 +1,188 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint, ScreenVector
+from screen_arrays import ScreenPointArray
+
+# Сценарий: подготовка данных (не измеряется) и измеряемая функция над ними
+Setup = Callable[[np.random.Generator, int], object]
+Scenario = Tuple[Setup, Callable[[object], object]]
+
+
+def _coordinates(rng: np.random.Generator, count: int) -> Tuple[List[int], List[int]]:
+    return (rng.integers(0, SCREEN_WIDTH + 1, count).tolist(),
+            rng.integers(0, SCREEN_HEIGHT + 1, count).tolist())
+
+
+def _points(rng: np.random.Generator, count: int) -> List[ScreenPoint]:
+    return [ScreenPoint(x, y) for x, y in zip(*_coordinates(rng, count))]
+
+
+def _vectors(rng: np.random.Generator, count: int) -> List[ScreenVector]:
+    dx = rng.integers(-SCREEN_WIDTH, SCREEN_WIDTH + 1, count).tolist()
+    dy = rng.integers(-SCREEN_HEIGHT, SCREEN_HEIGHT + 1, count).tolist()
+    return [ScreenVector(dx=a, dy=b) for a, b in zip(dx, dy)]
+
+
+def _vector_pairs(rng: np.random.Generator, count: int) -> Tuple[List[ScreenVector], List[ScreenVector]]:
+    return _vectors(rng, count), _vectors(rng, count)
+
+
+def _vector_triples(rng: np.random.Generator, count: int) -> Tuple[List[ScreenVector], ...]:
+    return _vectors(rng, count), _vectors(rng, count), _vectors(rng, count)
+
+
+def _invalid_coordinates(rng: np.random.Generator, count: int) -> List[int]:
+    return rng.integers(SCREEN_WIDTH + 1, 2 * SCREEN_WIDTH, count).tolist()
+
+
+def _construct_invalid(values: List[int]) -> int:
+    failures = 0
+    for value in values:
+        try:
+            ScreenPoint(value, 0)
+        except ValueError:
+            failures += 1
+    return failures
+
+
+def _assign(points: List[ScreenPoint]) -> None:
+    for point in points:
+        point.x = point.y
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    'point_construct': (_coordinates, lambda c: [ScreenPoint(x, y) for x, y in zip(*c)]),
+    'point_construct_invalid': (_invalid_coordinates, _construct_invalid),
+    'point_validate': (lambda rng, n: _coordinates(rng, n)[0],
+                       lambda xs: [ScreenPoint._validate_coordinate(x, SCREEN_WIDTH, 'x') for x in xs]),
+    'point_get_xy': (_points, lambda ps: sum(p.x + p.y for p in ps)),
+    'point_set_x': (_points, _assign),
+    'vector_construct': (_coordinates, lambda c: [ScreenVector(dx=x, dy=y) for x, y in zip(*c)]),
+    'vector_from_points': (lambda rng, n: (_points(rng, n), _points(rng, n)),
+                           lambda p: [ScreenVector(start=a, end=b) for a, b in zip(*p)]),
+    'vector_add': (_vector_pairs, lambda p: [a + b for a, b in zip(*p)]),
+    'vector_sub': (_vector_pairs, lambda p: [a - b for a, b in zip(*p)]),
+    'vector_mul': (_vectors, lambda vs: [v * 3 for v in vs]),
+    'vector_magnitude': (_vectors, lambda vs: [v.magnitude() for v in vs]),
+    'vector_dot': (_vector_pairs, lambda p: [ScreenVector.dot(a, b) for a, b in zip(*p)]),
+    'vector_cross': (_vector_pairs, lambda p: [ScreenVector.cross(a, b) for a, b in zip(*p)]),
+    'vector_triple_product': (_vector_triples,
+                              lambda t: [ScreenVector.triple_product(a, b, c) for a, b, c in zip(*t)]),
+    # Векторизованный путь для сравнения с поштучными объектами
+    'array_construct': (lambda rng, n: tuple(np.asarray(c) for c in _coordinates(rng, n)),
+                        lambda c: ScreenPointArray(*c)),
+}
+
+
+def measure(scenario: Scenario, size: int, repeats: int, seed: int) -> Dict[str, float]:
+    """Лучшее и медианное время сценария; данные готовятся заново для каждого повтора"""
+    setup, run = scenario
+    timings = []
+    for repeat in range(repeats):
+        state = setup(np.random.default_rng(seed + repeat), size)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state)
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del state
+    best = min(timings)
+    return {
+        'best_s': best,
+        'median_s': statistics.median(timings),
+        'ns_per_op': best / size * 1e9,
+        'ops_per_s': size / best,
+    }
+
+
+def run_suite(names: List[str], sizes: List[int], repeats: int, seed: int) -> dict:
+    results = []
+    for name in names:
+        for size in sizes:
+            entry = {'scenario': name, 'size': size}
+            entry.update(measure(SCENARIOS[name], size, repeats, seed))
+            results.append(entry)
+            print(f"{name:<26}{size:>10}{entry['ns_per_op']:>12.1f} ns/op", file=sys.stderr)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'numpy': np.__version__,
+            'seed': seed,
+            'repeats': repeats,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """Сравнивает ns/op с базовым прогоном; регрессия - замедление больше чем в (1 + threshold) раз"""
+    reference = {(r['scenario'], r['size']): r['ns_per_op'] for r in baseline['results']}
+    report = []
+    for result in current['results']:
+        key = (result['scenario'], result['size'])
+        if key not in reference:
+            continue
+        ratio = result['ns_per_op'] / reference[key]
+        report.append({'scenario': key[0], 'size': key[1], 'baseline_ns': reference[key],
+                       'current_ns': result['ns_per_op'], 'ratio': ratio,
+                       'regression': ratio > 1 + threshold})
+    return report
+
+
+def print_comparison(report: List[dict]) -> None:
+    print(f"{'scenario':<26}{'size':>10}{'baseline':>12}{'current':>12}{'ratio':>8}", file=sys.stderr)
+    for row in report:
+        mark = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['scenario']:<26}{row['size']:>10}{row['baseline_ns']:>12.1f}"
+              f"{row['current_ns']:>12.1f}{row['ratio']:>8.2f}{mark}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки горячих путей ScreenPoint/ScreenVector")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="число объектов; 10^7 требует нескольких ГБ памяти")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="файл для JSON с результатами (по умолчанию stdout)")
+    parser.add_argument("--baseline", help="JSON прошлого прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="допустимое относительное замедление")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.scenarios, args.sizes, args.repeats, args.seed)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as source:
+            report = compare(current, json.load(source), args.threshold)
+        print_comparison(report)
+        current['comparison'] = report
+        regressions = [row for row in report if row['regression']]
+
+    text = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as target:
+            target.write(text + '\n')
+    else:
+        print(text)
+    # Ненулевой код возврата, чтобы регрессию было видно в CI
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
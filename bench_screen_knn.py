@@ -0,0 +1,48 @@
+import argparse
+import time
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT
+from screen_arrays import ScreenPointArray
+from screen_knn import ScreenKDTree, brute_force_knn
+
+
+def random_points(rng: np.random.Generator, count: int) -> ScreenPointArray:
+    return ScreenPointArray(rng.integers(0, SCREEN_WIDTH + 1, count),
+                            rng.integers(0, SCREEN_HEIGHT + 1, count))
+
+
+def run_benchmark(sizes, query_count: int, k: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    queries = random_points(rng, query_count)
+    print(f"{'points':>10}{'build, s':>12}{'kd-tree, s':>12}{'brute, s':>12}{'speedup':>10}")
+    for size in sizes:
+        points = random_points(rng, size)
+
+        start = time.perf_counter()
+        tree = ScreenKDTree(points)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        tree_result = tree.query_batch(queries, k)
+        tree_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        brute_result = brute_force_knn(points, queries, k)
+        brute_time = time.perf_counter() - start
+
+        if not np.array_equal(tree_result[1], brute_result[1]):
+            raise AssertionError("KD-tree and brute force results differ")
+        print(f"{size:>10}{build_time:>12.3f}{tree_time:>12.3f}{brute_time:>12.3f}"
+              f"{brute_time / tree_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KD-дерево против полного перебора для k-NN")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_benchmark(args.sizes, args.queries, args.k, args.seed)
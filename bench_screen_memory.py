@@ -0,0 +1,57 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from oop1laba import ScreenPoint, ScreenVector
+from screen_compact import CompactScreenPoint, CompactScreenVector
+
+
+def measure_memory(factory: Callable[[int], object], count: int) -> float:
+    """Возвращает среднее число байт на один созданный объект"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Вычитаем стоимость самого списка ссылок
+    list_overhead = objects.__sizeof__()
+    del objects
+    return (after - before - list_overhead) / count
+
+
+def measure_throughput(factory: Callable[[int], object], count: int) -> float:
+    """Возвращает число созданных объектов в секунду"""
+    start = time.perf_counter()
+    for i in range(count):
+        factory(i)
+    return count / (time.perf_counter() - start)
+
+
+def point_factories() -> Tuple[Callable[[int], object], Callable[[int], object]]:
+    return (lambda i: ScreenPoint(i % 1920, i % 1080),
+            lambda i: CompactScreenPoint(i % 1920, i % 1080))
+
+
+def vector_factories() -> Tuple[Callable[[int], object], Callable[[int], object]]:
+    return (lambda i: ScreenVector(dx=i % 1920, dy=i % 1080),
+            lambda i: CompactScreenVector(dx=i % 1920, dy=i % 1080))
+
+
+def run_benchmark(count: int) -> None:
+    print(f"{'class':<22}{'bytes/instance':>16}{'instances/s':>16}")
+    for before, after in (point_factories(), vector_factories()):
+        for factory in (before, after):
+            label = type(factory(0)).__name__
+            size = measure_memory(factory, count)
+            rate = measure_throughput(factory, count)
+            print(f"{label:<22}{size:>16.1f}{rate:>16.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Память и скорость создания ScreenPoint/ScreenVector")
+    parser.add_argument("--count", type=int, default=1_000_000, help="число создаваемых объектов")
+    args = parser.parse_args()
+    run_benchmark(args.count)
@@ -0,0 +1,56 @@
+import argparse
+import itertools
+import random
+import time
+from typing import List, Tuple
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+from screen_segments import brute_force_intersections, find_intersections
+
+
+def random_segments(rng: random.Random, count: int, max_length: int) -> List[Tuple[ScreenPoint, ScreenPoint]]:
+    """Случайные отрезки длиной по каждой оси не больше max_length"""
+    segments = []
+    for _ in range(count):
+        x = rng.randint(0, SCREEN_WIDTH)
+        y = rng.randint(0, SCREEN_HEIGHT)
+        end_x = min(max(x + rng.randint(-max_length, max_length), 0), SCREEN_WIDTH)
+        end_y = min(max(y + rng.randint(-max_length, max_length), 0), SCREEN_HEIGHT)
+        segments.append((ScreenPoint(x, y), ScreenPoint(end_x, end_y)))
+    return segments
+
+
+def run_benchmark(count: int, max_length: int, brute_limit: int, seed: int) -> None:
+    rng = random.Random(seed)
+    segments = random_segments(rng, count, max_length)
+
+    start = time.perf_counter()
+    crossings = find_intersections(segments)
+    sweep_time = time.perf_counter() - start
+    pair_count = sum(len(c.segments) * (len(c.segments) - 1) // 2 for c in crossings)
+    print(f"segments={count} max_length={max_length}")
+    print(f"sweep: {len(crossings)} intersection points, {pair_count} pairs, {sweep_time:.2f} s")
+
+    if brute_limit:
+        subset = segments[:brute_limit]
+        start = time.perf_counter()
+        expected = set(brute_force_intersections(subset))
+        brute_time = time.perf_counter() - start
+        start = time.perf_counter()
+        found = set()
+        for crossing in find_intersections(subset):
+            found.update(itertools.combinations(crossing.segments, 2))
+        subset_sweep_time = time.perf_counter() - start
+        if found != expected:
+            raise AssertionError("Sweep and brute force results differ")
+        print(f"first {brute_limit}: sweep {subset_sweep_time:.2f} s, brute force {brute_time:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Заметание прямой против полного перебора пар отрезков")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--max-length", type=int, default=20)
+    parser.add_argument("--brute-limit", type=int, default=2000, help="размер подвыборки для полного перебора")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_benchmark(args.count, args.max_length, args.brute_limit, args.seed)
@@ -0,0 +1,50 @@
+import argparse
+import time
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT
+from screen_arrays import ScreenPointArray
+from screen_simplify import douglas_peucker, radial_prefilter, simplify_stream
+
+
+def random_walk(rng: np.random.Generator, count: int, step: int) -> ScreenPointArray:
+    """Траектория указателя: случайное блуждание, отраженное от границ экрана"""
+    def walk(limit: int) -> np.ndarray:
+        position = np.cumsum(rng.integers(-step, step + 1, count)) + limit // 2
+        # Отражение от краев: период 2 * limit
+        position = np.abs(position) % (2 * limit)
+        return np.where(position > limit, 2 * limit - position, position)
+    return ScreenPointArray(walk(SCREEN_WIDTH), walk(SCREEN_HEIGHT))
+
+
+def run_benchmark(count: int, epsilon: float, chunk_size: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    trace = random_walk(rng, count, step=3)
+    print(f"trace: {count} points, epsilon={epsilon}")
+
+    start = time.perf_counter()
+    radial = trace[radial_prefilter(trace, epsilon)]
+    radial_time = time.perf_counter() - start
+    print(f"radial prefilter: {len(radial)} points ({len(radial) / count:.1%}), {radial_time:.2f} s")
+
+    start = time.perf_counter()
+    kept = douglas_peucker(radial, epsilon)
+    dp_time = time.perf_counter() - start
+    print(f"douglas-peucker: {len(kept)} points ({len(kept) / count:.1%}), {dp_time:.2f} s")
+
+    chunks = (trace[i:i + chunk_size] for i in range(0, count, chunk_size))
+    start = time.perf_counter()
+    streamed = sum(len(part) for part in simplify_stream(chunks, epsilon))
+    stream_time = time.perf_counter() - start
+    print(f"stream (chunk={chunk_size}): {streamed} points ({streamed / count:.1%}), {stream_time:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сокращение точек и время упрощения траекторий")
+    parser.add_argument("--count", type=int, default=2_000_000)
+    parser.add_argument("--epsilon", type=float, default=2.0)
+    parser.add_argument("--chunk-size", type=int, default=1 << 16)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run_benchmark(args.count, args.epsilon, args.chunk_size, args.seed)
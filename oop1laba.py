@@ -1,10 +1,15 @@
-from math import sqrt
-from typing import Tuple, Iterator
+from math import isqrt, sqrt
+from typing import Tuple, Iterator, Optional
 
 # Константы экрана
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 
+# Число дробных бит в нормированных направлениях с фиксированной точкой
+FIXED_POINT_BITS = 16
+# Больше нельзя: пакетная версия берет корень из d^2 * 4^(bits+1) / |v|^2 <= 2^52 через float64
+FIXED_POINT_MAX_BITS = 25
+
 
 class ScreenPoint:
     """Класс для представления точки на экране с проверкой границ"""
@@ -29,6 +34,18 @@ class ScreenPoint:
     def y(self, value: int) -> None:
         self._y = self._validate_coordinate(value, SCREEN_HEIGHT, 'y')
 
+    @classmethod
+    def clamped(cls, x: int, y: int) -> 'ScreenPoint':
+        """Создает точку, прижимая координаты к границам экрана вместо исключения"""
+        return cls(min(max(x, 0), SCREEN_WIDTH), min(max(y, 0), SCREEN_HEIGHT))
+
+    @classmethod
+    def clipped(cls, x: int, y: int) -> Optional['ScreenPoint']:
+        """Создает точку или возвращает None, если она вне экрана"""
+        if 0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT:
+            return cls(x, y)
+        return None
+
     @staticmethod
     def _validate_coordinate(value: int, max_value: int, coord_name: str) -> int:
         """Проверяет корректность координаты"""
@@ -50,7 +67,38 @@ class ScreenPoint:
         return f"ScreenPoint({self._x}, {self._y})"
 
 
-class ScreenVector:
+def check_fixed_point_bits(bits: int) -> int:
+    """Проверяет число дробных бит (общая проверка для точки и пакетов)"""
+    if isinstance(bits, bool) or not isinstance(bits, int):
+        raise TypeError("Fixed-point bits must be integer")
+    if not 0 <= bits <= FIXED_POINT_MAX_BITS:
+        raise ValueError(f"Fixed-point bits must be between 0 and {FIXED_POINT_MAX_BITS}")
+    return bits
+
+
+def fixed_point_direction(dx: int, dy: int, bits: int = FIXED_POINT_BITS) -> Tuple[int, int]:
+    """Нормирует (dx, dy) к длине 2**bits только целочисленной арифметикой
+
+    Каждая компонента равна round(|d| * 2**bits / |v|) со знаком d:
+    round(sqrt(t)) = (isqrt(4t) + 1) // 2, где t = d^2 * 4^bits / |v|^2.
+    У нулевого вектора направления нет - результат (0, 0).
+    """
+    check_fixed_point_bits(bits)
+    if not isinstance(dx, int) or not isinstance(dy, int):
+        raise TypeError("Fixed-point normalization requires integer components")
+    squared = dx * dx + dy * dy
+    if squared == 0:
+        return 0, 0
+    scale = 1 << (2 * bits + 2)
+
+    def component(value: int) -> int:
+        rounded = (isqrt(value * value * scale // squared) + 1) // 2
+        return rounded if value >= 0 else -rounded
+
+    return component(dx), component(dy)
+
+
+class ScreenVector:
     """Класс для работы с 2D векторами на экране"""
 
     def __init__(self, dx: int = None, dy: int = None,
@@ -101,6 +149,19 @@ class ScreenVector:
     def __abs__(self) -> float:
         return self.magnitude()
 
+    def squared_magnitude(self) -> int:
+        """Квадрат длины без sqrt: для целых компонент результат точный"""
+        return self._dx * self._dx + self._dy * self._dy
+
+    def compare_magnitude(self, other: 'ScreenVector') -> int:
+        """Сравнивает длины по квадратам: -1, 0 или 1"""
+        first, second = self.squared_magnitude(), other.squared_magnitude()
+        return (first > second) - (first < second)
+
+    def normalized_fixed(self, bits: int = FIXED_POINT_BITS) -> 'ScreenVector':
+        """Единичное направление в фиксированной точке: компоненты ~ round(d / |v| * 2**bits)"""
+        return ScreenVector(*fixed_point_direction(self._dx, self._dy, bits))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ScreenVector):
             return False
@@ -135,6 +196,14 @@ class ScreenVector:
             raise ZeroDivisionError("Cannot divide by zero")
         return ScreenVector(dx=self._dx / scalar, dy=self._dy / scalar)
 
+    def __floordiv__(self, scalar: int) -> 'ScreenVector':
+        """Целочисленное деление: компоненты остаются int (в отличие от /)"""
+        if isinstance(scalar, bool) or not isinstance(scalar, int):
+            raise TypeError("Can only floor-divide by integer scalar")
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return ScreenVector(dx=self._dx // scalar, dy=self._dy // scalar)
+
     # Векторные операции
     def dot_product(self, other: 'ScreenVector') -> int:
         """Скалярное произведение векторов"""
@@ -1,8 +1,28 @@
+import hashlib
+import io
+import mmap
+import os
+import struct
+import sys
+import weakref
+from collections import OrderedDict
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, TextIO, Union
 from dataclasses import dataclass
 
 
+# Формат кэша разобранных шрифтов: заголовок, число строк каждого символа (uint16),
+# затем символы и их строки в UTF-8 через '\n' (после strip() в строках шрифта его нет)
+FONT_CACHE_MAGIC = b'SPFC'
+FONT_CACHE_VERSION = 1
+_FONT_CACHE_HEADER = struct.Struct('<4sBxxxQqI')   # магия, версия, размер и mtime_ns источника, число символов
+
+
+def default_font_cache_dir() -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'oop2lab', 'fonts')
+
+
 class TextColor(Enum):
     RED = '\033[31m'
     GREEN = '\033[32m'
@@ -34,20 +54,380 @@ class SymbolPatterns:
 
         return cls(char_patterns)
 
+    @classmethod
+    def from_file_cached(cls, filename: str, cache_dir: Optional[str] = None) -> 'SymbolPatterns':
+        """from_file с кэшем на диске: файл разбирается заново, только если изменились его размер или mtime"""
+        source = os.stat(filename)
+        cache_path = cls._cache_path(filename, cache_dir)
+        patterns = cls._read_cache(cache_path, source)
+        if patterns is not None:
+            return cls(patterns)
+
+        font = cls.from_file(filename)
+        try:
+            font._write_cache(cache_path, source)
+        except OSError:
+            # Кэш - только ускорение: без права записи просто работаем без него
+            pass
+        return font
+
+    @staticmethod
+    def _cache_path(filename: str, cache_dir: Optional[str]) -> str:
+        key = hashlib.sha256(os.path.abspath(filename).encode('utf-8')).hexdigest()[:32]
+        return os.path.join(cache_dir or default_font_cache_dir(), key + '.spfc')
+
+    @staticmethod
+    def _read_cache(cache_path: str, source: os.stat_result) -> Optional[Dict[str, List[str]]]:
+        try:
+            with open(cache_path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        try:
+            magic, version, size, mtime_ns, count = _FONT_CACHE_HEADER.unpack_from(data, 0)
+            if (magic, version, size, mtime_ns) != (FONT_CACHE_MAGIC, FONT_CACHE_VERSION,
+                                                    source.st_size, source.st_mtime_ns):
+                return None
+            row_counts = struct.unpack_from(f'<{count}H', data, _FONT_CACHE_HEADER.size)
+            text = data[_FONT_CACHE_HEADER.size + 2 * count:].decode('utf-8')
+        except (struct.error, UnicodeDecodeError):
+            # Поврежденный или обрезанный кэш равносилен его отсутствию
+            return None
+
+        strings = text.split('\n') if count else []
+        if len(strings) != count + sum(row_counts):
+            return None
+        patterns = {}
+        position = 0
+        for row_count in row_counts:
+            patterns[strings[position]] = strings[position + 1:position + 1 + row_count]
+            position += row_count + 1
+        return patterns
+
+    def _write_cache(self, cache_path: str, source: os.stat_result) -> None:
+        strings = []
+        for character, rows in self.patterns.items():
+            strings.append(character)
+            strings.extend(rows)
+        row_counts = [len(rows) for rows in self.patterns.values()]
+        parts = [_FONT_CACHE_HEADER.pack(FONT_CACHE_MAGIC, FONT_CACHE_VERSION, source.st_size,
+                                         source.st_mtime_ns, len(row_counts)),
+                 struct.pack(f'<{len(row_counts)}H', *row_counts),
+                 '\n'.join(strings).encode('utf-8')]
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Запись во временный файл и замена, чтобы параллельный запуск не прочитал половину
+        temporary = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as file:
+            file.write(b''.join(parts))
+        os.replace(temporary, cache_path)
+
     def get_pattern(self, character: str) -> List[str]:
         return self.patterns.get(character.upper(), [])
 
 
+# Порядок символов в файлах font_size_*.txt (как availableChars в main.cpp)
+BITSTREAM_CHARSET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ .,!?0123456789"
+
+
+@dataclass
+class BitmapFont:
+    """Шрифт с глифами в виде упакованных битов: одна строка глифа - один int
+
+    Старший бит строки - левый пиксель. Строки символов получаются только
+    при запросе и с любым символом заливки.
+    """
+    glyphs: Dict[str, Tuple[int, ...]]
+    width: int
+    height: int
+
+    @classmethod
+    def from_bitstream(cls, filename: str, glyph_width: Optional[int] = None,
+                       charset: str = BITSTREAM_CHARSET) -> 'BitmapFont':
+        """Читает файл, где каждая строка - ряд пикселей всех символов charset подряд"""
+        with open(filename, 'r') as file:
+            lines = [line.strip() for line in file if line.strip()]
+        if not lines:
+            raise ValueError(f"Font file {filename} is empty")
+
+        length = len(lines[0])
+        if any(len(line) != length for line in lines):
+            raise ValueError("All bitstream rows must have the same length")
+        if glyph_width is None:
+            glyph_width = length // len(charset)
+        if glyph_width < 1 or glyph_width * len(charset) != length:
+            raise ValueError(f"Row length {length} does not match {len(charset)} glyphs of width {glyph_width}")
+        if set(''.join(lines)) - {'0', '1'}:
+            raise ValueError("Bitstream rows may contain only '0' and '1'")
+
+        # Вся строка файла - одно большое число, глифы вырезаются сдвигом и маской
+        mask = (1 << glyph_width) - 1
+        packed_lines = [int(line, 2) for line in lines]
+        last = len(charset) - 1
+        glyphs = {}
+        for index, character in enumerate(charset):
+            shift = glyph_width * (last - index)
+            glyphs[character] = tuple((row >> shift) & mask for row in packed_lines)
+        return cls(glyphs, glyph_width, len(lines))
+
+    def __contains__(self, character: str) -> bool:
+        return character.upper() in self.glyphs
+
+    def decode(self, character: str, fill_char: str = '*', empty_char: str = ' ') -> List[str]:
+        rows = self.glyphs.get(character.upper())
+        if rows is None:
+            return []
+        table = str.maketrans({'1': fill_char, '0': empty_char})
+        return [format(row, f'0{self.width}b').translate(table) for row in rows]
+
+    def get_pattern(self, character: str) -> List[str]:
+        """Совместимо с SymbolPatterns: '*' - пиксель, пробел - фон"""
+        return self.decode(character)
+
+
+# Индексированный файл шрифта: заголовок, таблица смещений по возрастанию кода символа,
+# затем строки глифов в UTF-8 через '\n'
+INDEXED_FONT_MAGIC = b'SPFI'
+INDEXED_FONT_VERSION = 2
+# магия, версия, размер и mtime_ns исходного файла, число символов
+_INDEX_HEADER = struct.Struct('<4sBxxxQqI')
+_INDEX_ENTRY = struct.Struct('<IQI')         # код символа, смещение данных, длина данных
+
+
+class IndexedFont:
+    """Шрифт в индексированном файле: глиф читается через mmap при первом get_pattern
+
+    Поиск символа - двоичный поиск по таблице смещений прямо в отображенном
+    файле, поэтому затраты зависят от числа реально выведенных символов,
+    а не от размера шрифта.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, 'rb') as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.source_size, self.source_mtime_ns, self._count = \
+                _INDEX_HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self._map.close()
+            raise ValueError(f"{filename} is not an indexed font file")
+        if magic != INDEXED_FONT_MAGIC or version != INDEXED_FONT_VERSION:
+            self._map.close()
+            raise ValueError(f"{filename} is not an indexed font file of version {INDEXED_FONT_VERSION}")
+        self._data_start = _INDEX_HEADER.size + self._count * _INDEX_ENTRY.size
+        if self._data_start > len(self._map):
+            self._map.close()
+            raise ValueError(f"Index table of {filename} is truncated")
+        self._loaded: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def build(font: SymbolPatterns, filename: str, source: Optional[os.stat_result] = None) -> None:
+        """Записывает шрифт в индексированный формат; ключи шрифта должны быть одиночными символами
+
+        source - stat исходного текстового файла, по нему from_file узнает устаревший индекс.
+        """
+        if any(len(character) != 1 for character in font.patterns):
+            raise ValueError("Indexed fonts support only single-character keys")
+        entries, blobs, offset = [], [], 0
+        for character in sorted(font.patterns, key=ord):
+            blob = '\n'.join(font.patterns[character]).encode('utf-8')
+            entries.append(_INDEX_ENTRY.pack(ord(character), offset, len(blob)))
+            blobs.append(blob)
+            offset += len(blob)
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as file:
+            file.write(_INDEX_HEADER.pack(INDEXED_FONT_MAGIC, INDEXED_FONT_VERSION,
+                                          source.st_size if source else 0,
+                                          source.st_mtime_ns if source else 0, len(entries)))
+            file.write(b''.join(entries))
+            file.write(b''.join(blobs))
+        try:
+            os.replace(temporary, filename)
+        except OSError:
+            os.remove(temporary)
+            raise
+
+    @classmethod
+    def from_file(cls, filename: str, index_filename: Optional[str] = None,
+                  cache_dir: Optional[str] = None) -> 'IndexedFont':
+        """Открывает индекс текстового шрифта, перестраивая его, если источник изменился
+
+        По умолчанию индекс лежит рядом со шрифтом (<font>.spfi); если туда нельзя
+        писать, он строится в каталоге кэша, как у SymbolPatterns.from_file_cached.
+        """
+        if index_filename:
+            candidates = [index_filename]
+        else:
+            cached = os.path.splitext(SymbolPatterns._cache_path(filename, cache_dir))[0] + '.spfi'
+            candidates = [os.path.splitext(filename)[0] + '.spfi', cached]
+        source = os.stat(filename)
+        for candidate in candidates:
+            font = cls._open_current(candidate, source)
+            if font is not None:
+                return font
+
+        patterns = SymbolPatterns.from_file(filename)
+        for candidate in candidates:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(candidate)), exist_ok=True)
+                cls.build(patterns, candidate, source)
+            except OSError:
+                if candidate is candidates[-1]:
+                    raise
+                continue
+            return cls(candidate)
+
+    @classmethod
+    def _open_current(cls, index_filename: str, source: os.stat_result) -> Optional['IndexedFont']:
+        """Индекс, если он есть и построен из этой версии источника, иначе None"""
+        try:
+            font = cls(index_filename)
+        except (OSError, ValueError):
+            return None
+        # Как и кэш разбора: сверяем размер и mtime источника, а не время индекса
+        if (font.source_size, font.source_mtime_ns) == (source.st_size, source.st_mtime_ns):
+            return font
+        font.close()
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def loaded_count(self) -> int:
+        """Сколько глифов уже прочитано из файла"""
+        return len(self._loaded)
+
+    def _find(self, codepoint: int) -> Optional[Tuple[int, int]]:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            code, offset, length = _INDEX_ENTRY.unpack_from(self._map, _INDEX_HEADER.size + middle * _INDEX_ENTRY.size)
+            if code == codepoint:
+                return self._data_start + offset, length
+            if code < codepoint:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def __contains__(self, character: str) -> bool:
+        character = character.upper()
+        return len(character) == 1 and self._find(ord(character)) is not None
+
+    def get_pattern(self, character: str) -> List[str]:
+        character = character.upper()
+        pattern = self._loaded.get(character)
+        if pattern is not None:
+            return pattern
+        location = self._find(ord(character)) if len(character) == 1 else None
+        if location is None:
+            return []
+        start, length = location
+        pattern = self._map[start:start + length].decode('utf-8').split('\n') if length else []
+        self._loaded[character] = pattern
+        return pattern
+
+
+AnyFont = Union[SymbolPatterns, BitmapFont, IndexedFont]
+
+
+@dataclass
+class GlyphCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class GlyphCache:
+    """Готовые строки символов (шаблон с подставленным fill_char) по ключу (шрифт, символ, fill_char)"""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._glyphs: 'OrderedDict[Tuple[int, str, str], Tuple[str, ...]]' = OrderedDict()
+        # Слабые ссылки на шрифты: когда шрифт удаляется, его строки уходят из кэша
+        # раньше, чем id в ключе может достаться другому объекту
+        self._fonts: Dict[int, weakref.ref] = {}
+        self._stats = GlyphCacheStats()
+
+    def get(self, font: AnyFont, character: str, fill_char: str) -> Tuple[str, ...]:
+        key = (id(font), character, fill_char)
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self._stats.hits += 1
+            self._glyphs.move_to_end(key)
+            return glyph
+
+        self._stats.misses += 1
+        if isinstance(font, BitmapFont):
+            glyph = tuple(font.decode(character, fill_char))
+        else:
+            glyph = tuple(row.replace('*', fill_char) for row in font.get_pattern(character))
+        font_id = id(font)
+        if font_id not in self._fonts:
+            cache = weakref.ref(self)
+
+            def forget(_, font_id=font_id):
+                if cache() is not None:
+                    cache()._forget(font_id)
+
+            self._fonts[font_id] = weakref.ref(font, forget)
+        self._glyphs[key] = glyph
+        if len(self._glyphs) > self.max_size:
+            self._glyphs.popitem(last=False)
+            self._stats.evictions += 1
+        return glyph
+
+    def invalidate(self, font: AnyFont) -> None:
+        """Сбрасывает строки шрифта после изменения его шаблонов"""
+        self._forget(id(font))
+
+    def _forget(self, font_id: int) -> None:
+        for key in [key for key in self._glyphs if key[0] == font_id]:
+            del self._glyphs[key]
+        self._fonts.pop(font_id, None)
+
+    def clear(self) -> None:
+        self._glyphs.clear()
+        self._fonts.clear()
+        self._stats = GlyphCacheStats()
+
+    @property
+    def stats(self) -> GlyphCacheStats:
+        return GlyphCacheStats(self._stats.hits, self._stats.misses, self._stats.evictions, len(self._glyphs))
+
+
 class ConsoleArtPrinter:
+    # Общий для всех принтеров кэш; можно передать свой через glyph_cache
+    shared_glyph_cache = GlyphCache()
+
     def __init__(self,
                  color: TextColor = TextColor.DEFAULT,
                  start_pos: Tuple[int, int] = (1, 1),
                  fill_char: str = '*',
-                 font: SymbolPatterns = None):
+                 font: AnyFont = None,
+                 glyph_cache: Optional[GlyphCache] = None):
         self.color = color
         self.position = start_pos
         self.fill_char = fill_char
         self.font = font
+        self.glyph_cache = glyph_cache or self.shared_glyph_cache
 
     def __enter__(self):
         return self
@@ -55,21 +435,26 @@ class ConsoleArtPrinter:
     def __exit__(self, exc_type, exc_val, exc_tb):
         print(TextColor.DEFAULT.value, end='')
 
-    def render_text(self, message: str) -> None:
+    def compose_text(self, message: str) -> str:
         base_y, base_x = self.position
+        glyphs = [self.glyph_cache.get(self.font, char, self.fill_char) for char in message]
+        # Цвет задается один раз на весь баннер, а не в каждой строке
+        parts = [self.color.value]
 
-        for line_num in range(5):
-            output_line = []
-
-            for char in message:
-                char_lines = self.font.get_pattern(char)
-                if line_num < len(char_lines):
-                    rendered_line = char_lines[line_num].replace('*', self.fill_char)
-                    output_line.append(rendered_line)
+        for line_num in range(getattr(self.font, 'height', 5)):
+            # Символ без строки line_num (или без шаблона) в этой строке пропускается
+            output_line = [glyph[line_num] for glyph in glyphs if line_num < len(glyph)]
 
             if output_line:
                 combined_line = '  '.join(output_line)
-                print(f"\033[{base_y + line_num};{base_x}H{self.color.value}{combined_line}")
+                parts.append(f"\033[{base_y + line_num};{base_x}H{combined_line}\n")
+
+        return ''.join(parts) if len(parts) > 1 else ''
+
+    def render_text(self, message: str) -> None:
+        frame = self.compose_text(message)
+        if frame:
+            sys.stdout.write(frame)
 
     @classmethod
     def quick_print(cls,
@@ -77,15 +462,70 @@ class ConsoleArtPrinter:
                     color: TextColor,
                     position: Tuple[int, int],
                     symbol: str,
-                    font_data: SymbolPatterns):
+                    font_data: AnyFont):
         with cls(color, position, symbol, font_data) as printer:
             printer.render_text(text)
 
 
+class FrameBuilder:
+    """Собирает вывод нескольких принтеров в один кадр и выводит его одной записью"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+        self._parts: List[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def add_text(self, printer: ConsoleArtPrinter, message: str) -> 'FrameBuilder':
+        self._parts.append(printer.compose_text(message))
+        return self
+
+    def add_raw(self, text: str) -> 'FrameBuilder':
+        self._parts.append(text)
+        return self
+
+    def compose(self) -> str:
+        if not any(self._parts):
+            return ''
+        return ''.join(self._parts) + TextColor.DEFAULT.value
+
+    def flush(self) -> int:
+        frame = self.compose()
+        self._parts = []
+        if not frame:
+            return 0
+        stream = self.stream or sys.stdout
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            stream.write(frame)
+            stream.flush()
+            return len(frame)
+
+        # Уже накопленное в буфере потока должно выйти раньше кадра
+        stream.flush()
+        data = memoryview(frame.encode(getattr(stream, 'encoding', None) or 'utf-8'))
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+        return written
+
+
 if __name__ == "__main__":
-    font_data = SymbolPatterns.from_file("letters.txt")
+    font_data = SymbolPatterns.from_file_cached("letters.txt")
 
     ConsoleArtPrinter.quick_print("WB", TextColor.BLUE, (5, 5), "*", font_data)
 
     with ConsoleArtPrinter(TextColor.CYAN, (10, 10), "№", font_data) as artist:
         artist.render_text("HE")
+
+    with FrameBuilder() as frame:
+        frame.add_text(ConsoleArtPrinter(TextColor.RED, (16, 5), "#", font_data), "WE")
+        frame.add_text(ConsoleArtPrinter(TextColor.GREEN, (16, 25), "@", font_data), "HB")
+
+    bitmap_font = BitmapFont.from_bitstream(os.path.join("2Lab_Pseudographic_Text", "font_size_7.txt"))
+    ConsoleArtPrinter.quick_print("HELLO!", TextColor.YELLOW, (22, 5), "#", bitmap_font)
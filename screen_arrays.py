@@ -0,0 +1,404 @@
+import numbers
+from enum import Enum
+from typing import Iterable, Iterator, List, Sequence, Union
+
+import numpy as np
+
+from oop1laba import (FIXED_POINT_BITS, SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint, ScreenVector,
+                      check_fixed_point_bits, fixed_point_direction)
+
+
+class ScreenPointArray:
+    """Колоночный массив точек экрана (int32 x/y) с пакетной проверкой границ"""
+
+    def __init__(self, x: Iterable[int], y: Iterable[int]):
+        x = self._validate_coordinates(x, SCREEN_WIDTH, 'x')
+        y = self._validate_coordinates(y, SCREEN_HEIGHT, 'y')
+        if x.shape != y.shape:
+            raise ValueError("x and y arrays must have the same length")
+        self._x = x
+        self._y = y
+
+    @classmethod
+    def _from_trusted(cls, x: np.ndarray, y: np.ndarray) -> 'ScreenPointArray':
+        """Создает массив без повторной проверки уже корректных координат"""
+        obj = cls.__new__(cls)
+        obj._x = x
+        obj._y = y
+        return obj
+
+    @classmethod
+    def clamped(cls, x: Iterable[int], y: Iterable[int]) -> 'ScreenPointArray':
+        """Создает массив, прижимая координаты к границам экрана вместо исключения"""
+        x = np.clip(np.asarray(x), 0, SCREEN_WIDTH)
+        y = np.clip(np.asarray(y), 0, SCREEN_HEIGHT)
+        return cls(x, y)
+
+    @classmethod
+    def clipped(cls, x: Iterable[int], y: Iterable[int]) -> 'ScreenPointArray':
+        """Создает массив только из точек, попадающих на экран"""
+        x = np.asarray(x)
+        y = np.asarray(y)
+        visible = (x >= 0) & (x <= SCREEN_WIDTH) & (y >= 0) & (y <= SCREEN_HEIGHT)
+        return cls(x[visible], y[visible])
+
+    @staticmethod
+    def _validate_coordinates(values: Iterable[int], max_value: int, coord_name: str) -> np.ndarray:
+        """Проверяет все координаты за один векторный проход"""
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(f"{coord_name} coordinates must be a one-dimensional array")
+        if values.size == 0:
+            return np.zeros(0, dtype=np.int32)
+        if values.dtype.kind not in 'iu':
+            raise TypeError(f"{coord_name} coordinates must be integer")
+        if values.min() < 0 or values.max() > max_value:
+            raise ValueError(f"{coord_name} coordinate must be between 0 and {max_value}")
+        return values.astype(np.int32, copy=False)
+
+    @classmethod
+    def from_points(cls, points: Iterable[ScreenPoint]) -> 'ScreenPointArray':
+        """Собирает массив из списка ScreenPoint (точки уже проверены)"""
+        points = list(points)
+        x = np.fromiter((p.x for p in points), dtype=np.int32, count=len(points))
+        y = np.fromiter((p.y for p in points), dtype=np.int32, count=len(points))
+        return cls._from_trusted(x, y)
+
+    def to_points(self) -> List[ScreenPoint]:
+        """Преобразует массив в список ScreenPoint"""
+        return [ScreenPoint(x, y) for x, y in zip(self._x.tolist(), self._y.tolist())]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[ScreenPoint, 'ScreenPointArray']:
+        if isinstance(index, numbers.Integral):
+            return ScreenPoint(int(self._x[index]), int(self._y[index]))
+        return ScreenPointArray._from_trusted(self._x[index], self._y[index])
+
+    def __iter__(self) -> Iterator[ScreenPoint]:
+        return iter(self.to_points())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScreenPointArray):
+            return False
+        return np.array_equal(self._x, other.x) and np.array_equal(self._y, other.y)
+
+    def __repr__(self) -> str:
+        return f"ScreenPointArray(n={len(self)})"
+
+
+# Пакет точек или обычная последовательность ScreenPoint
+PointSet = Union[ScreenPointArray, Sequence[ScreenPoint]]
+
+
+def as_point_array(points: PointSet) -> ScreenPointArray:
+    """Пакет точек без копирования, если он уже ScreenPointArray"""
+    if isinstance(points, ScreenPointArray):
+        return points
+    return ScreenPointArray.from_points(points)
+
+
+class VectorDtype(Enum):
+    """Политика типа компонент пакета векторов"""
+    AUTO = 'auto'        # int32, int64 при переполнении, float64 для дробных
+    INT32 = 'int32'
+    INT64 = 'int64'
+    FLOAT64 = 'float64'
+
+
+def _isqrt(values: np.ndarray) -> np.ndarray:
+    """Поэлементный целый корень для неотрицательных int64 (до 2**52)"""
+    roots = np.sqrt(values.astype(np.float64)).astype(np.int64)
+    roots -= roots * roots > values
+    roots += (roots + 1) * (roots + 1) <= values
+    return roots
+
+
+class ScreenVectorArray:
+    """Колоночный массив 2D векторов с векторизованными операциями
+
+    Тип компонент задается политикой dtype. При целочисленной политике
+    дробные компоненты не появляются молча: float на входе, деление через /
+    и умножение на дробное дают TypeError, а выход за int32 - ValueError.
+    """
+
+    def __init__(self, dx: Iterable[Union[int, float]], dy: Iterable[Union[int, float]],
+                 dtype: Union[VectorDtype, str] = VectorDtype.AUTO):
+        self._policy = VectorDtype(dtype)
+        if self._policy is VectorDtype.AUTO:
+            dx = self._as_components(dx)
+            dy = self._as_components(dy)
+        else:
+            dx = self._cast_components(dx, self._policy)
+            dy = self._cast_components(dy, self._policy)
+        if dx.shape != dy.shape:
+            raise ValueError("dx and dy arrays must have the same length")
+        if dx.dtype != dy.dtype:
+            wide = np.float64 if 'f' in (dx.dtype.kind, dy.dtype.kind) else np.int64
+            dx = dx.astype(wide)
+            dy = dy.astype(wide)
+        self._dx = dx
+        self._dy = dy
+
+    @staticmethod
+    def _as_components(values: Iterable[Union[int, float]]) -> np.ndarray:
+        """Целые компоненты хранятся в int32 (int64 при переполнении), дробные - в float64"""
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("Vector components must be a one-dimensional array")
+        if values.size == 0:
+            return values.astype(np.int32)
+        if values.dtype.kind in 'iub':
+            info = np.iinfo(np.int32)
+            if values.min() < info.min or values.max() > info.max:
+                return values.astype(np.int64, copy=False)
+            return values.astype(np.int32, copy=False)
+        if values.dtype.kind == 'f':
+            return values.astype(np.float64, copy=False)
+        raise TypeError("Vector components must be numeric")
+
+    @staticmethod
+    def _cast_components(values: Iterable[Union[int, float]], policy: VectorDtype) -> np.ndarray:
+        """Приводит компоненты к типу явной политики без потери точности"""
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError("Vector components must be a one-dimensional array")
+        target = np.dtype(policy.value)
+        if values.size == 0:
+            return values.astype(target)
+        if values.dtype.kind not in 'iubf':
+            raise TypeError("Vector components must be numeric")
+        if target.kind == 'f':
+            return values.astype(target, copy=False)
+        if values.dtype.kind == 'f':
+            raise TypeError(f"{policy.value} vector policy does not accept float components")
+        info = np.iinfo(target)
+        if values.min() < info.min or values.max() > info.max:
+            raise ValueError(f"Vector components do not fit into {policy.value}")
+        return values.astype(target, copy=False)
+
+    def _new(self, dx: np.ndarray, dy: np.ndarray) -> 'ScreenVectorArray':
+        """Результат операции с той же политикой типа"""
+        return ScreenVectorArray(dx, dy, self._policy)
+
+    @property
+    def dtype_policy(self) -> VectorDtype:
+        return self._policy
+
+    @property
+    def is_integer(self) -> bool:
+        return self._dx.dtype.kind in 'iu'
+
+    @classmethod
+    def between(cls, start: ScreenPointArray, end: ScreenPointArray,
+                dtype: Union[VectorDtype, str] = VectorDtype.AUTO) -> 'ScreenVectorArray':
+        """Векторы из точек start в точки end (аналог ScreenVector(start=, end=))"""
+        if len(start) != len(end):
+            raise ValueError("start and end arrays must have the same length")
+        return cls(end.x - start.x, end.y - start.y, dtype)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[ScreenVector],
+                     dtype: Union[VectorDtype, str] = VectorDtype.AUTO) -> 'ScreenVectorArray':
+        """Собирает массив из списка ScreenVector"""
+        vectors = list(vectors)
+        return cls([v.dx for v in vectors], [v.dy for v in vectors], dtype)
+
+    def to_vectors(self) -> List[ScreenVector]:
+        """Преобразует массив в список ScreenVector"""
+        return [ScreenVector(dx=dx, dy=dy) for dx, dy in zip(self._dx.tolist(), self._dy.tolist())]
+
+    @property
+    def dx(self) -> np.ndarray:
+        return self._dx
+
+    @property
+    def dy(self) -> np.ndarray:
+        return self._dy
+
+    def __len__(self) -> int:
+        return len(self._dx)
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[ScreenVector, 'ScreenVectorArray']:
+        if isinstance(index, numbers.Integral):
+            return ScreenVector(dx=self._dx[index].item(), dy=self._dy[index].item())
+        return self._new(self._dx[index], self._dy[index])
+
+    def __iter__(self) -> Iterator[ScreenVector]:
+        return iter(self.to_vectors())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScreenVectorArray):
+            return False
+        return np.array_equal(self._dx, other.dx) and np.array_equal(self._dy, other.dy)
+
+    def __repr__(self) -> str:
+        return f"ScreenVectorArray(n={len(self)}, dtype={self._dx.dtype}, policy={self._policy.value})"
+
+    def _other_components(self, other: Union['ScreenVectorArray', ScreenVector], operation: str):
+        """Компоненты второго операнда: массив той же длины или один вектор"""
+        if isinstance(other, ScreenVectorArray):
+            if len(other) != len(self):
+                raise ValueError(f"Cannot {operation} vector arrays of different length")
+            return other.dx, other.dy
+        if isinstance(other, ScreenVector):
+            return other.dx, other.dy
+        raise TypeError(f"Can only {operation} ScreenVectorArray or ScreenVector")
+
+    @staticmethod
+    def _check_scalar(scalar: Union[int, float], operation: str) -> None:
+        if isinstance(scalar, bool) or not isinstance(scalar, numbers.Real):
+            raise TypeError(f"Can only {operation} by scalar (int or float)")
+
+    def _check_integer_policy(self, scalar: Union[int, float], operation: str) -> None:
+        """При целочисленной политике дробный скаляр - ошибка, а не молчаливый float"""
+        if self._policy in (VectorDtype.INT32, VectorDtype.INT64) and not isinstance(scalar, numbers.Integral):
+            raise TypeError(f"Can only {operation} {self._policy.value} vectors by integer scalar")
+
+    # Арифметические операции (в int64, чтобы int32 не переполнялся незаметно)
+    def __add__(self, other: Union['ScreenVectorArray', ScreenVector]) -> 'ScreenVectorArray':
+        dx, dy = self._other_components(other, 'add')
+        sdx, sdy = self._wide()
+        return self._new(sdx + dx, sdy + dy)
+
+    def __sub__(self, other: Union['ScreenVectorArray', ScreenVector]) -> 'ScreenVectorArray':
+        dx, dy = self._other_components(other, 'subtract')
+        sdx, sdy = self._wide()
+        return self._new(sdx - dx, sdy - dy)
+
+    def __mul__(self, scalar: Union[int, float]) -> 'ScreenVectorArray':
+        self._check_scalar(scalar, 'multiply')
+        self._check_integer_policy(scalar, 'multiply')
+        sdx, sdy = self._wide()
+        return self._new(sdx * scalar, sdy * scalar)
+
+    def __truediv__(self, scalar: Union[int, float]) -> 'ScreenVectorArray':
+        self._check_scalar(scalar, 'divide')
+        if self._policy in (VectorDtype.INT32, VectorDtype.INT64):
+            raise TypeError(f"True division of {self._policy.value} vectors is not allowed, use //")
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return self._new(self._dx / scalar, self._dy / scalar)
+
+    def __floordiv__(self, scalar: int) -> 'ScreenVectorArray':
+        """Целочисленное деление компонент (округление вниз, как у int)"""
+        self._check_scalar(scalar, 'divide')
+        self._check_integer_policy(scalar, 'divide')
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return self._new(self._dx // scalar, self._dy // scalar)
+
+    # Векторные операции
+    def _wide(self) -> tuple:
+        """Компоненты в int64/float64, чтобы произведения не переполняли int32"""
+        if self._dx.dtype.kind == 'f':
+            return self._dx, self._dy
+        return self._dx.astype(np.int64), self._dy.astype(np.int64)
+
+    def magnitude(self) -> np.ndarray:
+        """Возвращает длины всех векторов"""
+        return np.hypot(self._dx, self._dy)
+
+    def squared_magnitude(self) -> np.ndarray:
+        """Квадраты длин; для целых компонент - точные int64 без sqrt"""
+        dx, dy = self._wide()
+        return dx * dx + dy * dy
+
+    def compare_magnitude(self, other: Union['ScreenVectorArray', ScreenVector]) -> np.ndarray:
+        """Поэлементное сравнение длин по квадратам: -1, 0 или 1 (int8)"""
+        dx, dy = self._other_components(other, 'compare')
+        if isinstance(other, ScreenVector):
+            other_squared = dx * dx + dy * dy
+        else:
+            other_squared = other.squared_magnitude()
+        return np.sign(self.squared_magnitude() - other_squared).astype(np.int8)
+
+    def longer_than(self, length: int) -> np.ndarray:
+        """Маска векторов длиннее length (сравнение квадратов)"""
+        return self.squared_magnitude() > length * length
+
+    def normalized_fixed(self, bits: int = FIXED_POINT_BITS) -> 'ScreenVectorArray':
+        """Направления в фиксированной точке, как ScreenVector.normalized_fixed
+
+        Считается в int64: d^2 * 4^(bits+1) / |v|^2 делится по частям сдвига,
+        чтобы промежуточные произведения не переполнялись. Векторы с компонентами
+        больше 2^30 считаются скалярной fixed_point_direction. Нулевые векторы
+        остаются нулевыми.
+        """
+        check_fixed_point_bits(bits)
+        if not self.is_integer:
+            raise TypeError("Fixed-point normalization requires integer components")
+        dx, dy = self._wide()
+        huge = (np.abs(dx) > 1 << 30) | (np.abs(dy) > 1 << 30)
+        small_dx, small_dy = np.where(huge, 0, dx), np.where(huge, 0, dy)
+        divisor = np.maximum(small_dx * small_dx + small_dy * small_dy, 1)
+        # Остаток меньше делителя, поэтому за шаг можно сдвинуть его так, чтобы не выйти за 2^63
+        step = 62 - int(divisor.max()).bit_length() if len(self) else 62
+
+        def component(values: np.ndarray) -> np.ndarray:
+            quotient = np.zeros_like(values)
+            remainder = values * values
+            remaining = 2 * bits + 2
+            while remaining:
+                shift = min(remaining, step)
+                remainder <<= shift
+                quotient = (quotient << shift) + remainder // divisor
+                remainder %= divisor
+                remaining -= shift
+            rounded = (_isqrt(quotient) + 1) // 2
+            return np.where(values >= 0, rounded, -rounded)
+
+        result_dx, result_dy = component(small_dx), component(small_dy)
+        for i in np.flatnonzero(huge):
+            result_dx[i], result_dy[i] = fixed_point_direction(int(dx[i]), int(dy[i]), bits)
+        return self._new(result_dx, result_dy)
+
+    def dot_product(self, other: Union['ScreenVectorArray', ScreenVector]) -> np.ndarray:
+        """Поэлементное скалярное произведение"""
+        dx, dy = self._other_components(other, 'multiply')
+        sdx, sdy = self._wide()
+        return sdx * dx + sdy * dy
+
+    @classmethod
+    def dot(cls, v1: 'ScreenVectorArray', v2: Union['ScreenVectorArray', ScreenVector]) -> np.ndarray:
+        """Статический метод скалярного произведения"""
+        return v1.dot_product(v2)
+
+    def cross_product(self, other: Union['ScreenVectorArray', ScreenVector]) -> np.ndarray:
+        """Поэлементное векторное произведение (псевдоскаляр)"""
+        dx, dy = self._other_components(other, 'multiply')
+        sdx, sdy = self._wide()
+        return sdx * dy - sdy * dx
+
+    @classmethod
+    def cross(cls, v1: 'ScreenVectorArray', v2: Union['ScreenVectorArray', ScreenVector]) -> np.ndarray:
+        """Статический метод векторного произведения"""
+        return v1.cross_product(v2)
+
+
+def demonstrate_batch_operations():
+    """Демонстрация пакетной работы с точками и векторами"""
+    starts = ScreenPointArray([100, 150, 200], [200, 250, 300])
+    ends = ScreenPointArray.from_points([ScreenPoint(150, 250), ScreenPoint(200, 300), ScreenPoint(0, 0)])
+
+    vectors = ScreenVectorArray.between(starts, ends)
+    print(f"Векторы: {vectors.to_vectors()}")
+    print(f"Длины: {vectors.magnitude()}")
+    print(f"Сумма с (50, 50): {(vectors + ScreenVector(dx=50, dy=50)).to_vectors()}")
+    print(f"Умножение на 2: {(vectors * 2).to_vectors()}")
+    print(f"Деление на 2: {(vectors / 2).to_vectors()}")
+    print(f"Скалярные произведения: {vectors.dot_product(vectors)}")
+    print(f"Векторные произведения: {vectors.cross_product(ScreenVector(dx=1, dy=0))}")
+
+
+if __name__ == "__main__":
+    demonstrate_batch_operations()
@@ -0,0 +1,177 @@
+import mmap
+import os
+import struct
+import tempfile
+from enum import Enum
+from typing import BinaryIO, Iterable, Optional, Union
+
+import numpy as np
+
+from oop1laba import ScreenPoint, ScreenVector
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+
+# Заголовок: сигнатура, версия, тип записей, ширина компоненты в байтах, резерв, число записей
+MAGIC = b'SPVS'
+VERSION = 1
+HEADER = struct.Struct('<4sBBBxQ')
+
+Batch = Union[ScreenPointArray, ScreenVectorArray, Iterable[ScreenPoint], Iterable[ScreenVector]]
+
+
+class RecordKind(Enum):
+    POINT = 0
+    VECTOR = 1
+
+
+def _record_dtype(width: int) -> np.dtype:
+    if width not in (2, 4):
+        raise ValueError("Component width must be 2 (int16) or 4 (int32) bytes")
+    return np.dtype('<i2' if width == 2 else '<i4')
+
+
+class PackedStreamWriter:
+    """Потоковая запись точек или векторов в компактный двоичный формат
+
+    Каждая запись - пара little-endian int16/int32 (x, y) или (dx, dy);
+    число записей дописывается в заголовок при закрытии.
+    """
+
+    def __init__(self, filename: str, kind: RecordKind = RecordKind.POINT, width: int = 2):
+        self.filename = filename
+        self.kind = RecordKind(kind)
+        self.width = width
+        self._dtype = _record_dtype(width)
+        self._count = 0
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self):
+        self._file = open(self.filename, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.kind.value, self.width, 0))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.kind.value, self.width, self._count))
+        self._file.close()
+        self._file = None
+
+    def _columns(self, batch: Batch):
+        if self.kind is RecordKind.POINT:
+            if not isinstance(batch, ScreenPointArray):
+                batch = ScreenPointArray.from_points(batch)
+            return batch.x, batch.y
+        if not isinstance(batch, ScreenVectorArray):
+            batch = ScreenVectorArray.from_vectors(batch)
+        if batch.dx.dtype.kind == 'f':
+            raise TypeError("Only integer vectors can be packed")
+        return batch.dx, batch.dy
+
+    def write(self, batch: Batch) -> None:
+        """Дописывает пакет записей"""
+        if self._file is None:
+            raise ValueError("Writer must be used as a context manager")
+        first, second = self._columns(batch)
+        info = np.iinfo(self._dtype)
+        if len(first) and (min(first.min(), second.min()) < info.min
+                           or max(first.max(), second.max()) > info.max):
+            raise ValueError(f"Components do not fit into {self.width}-byte records")
+        records = np.empty((len(first), 2), dtype=self._dtype)
+        records[:, 0] = first
+        records[:, 1] = second
+        self._file.write(records.tobytes())
+        self._count += len(first)
+
+
+class PackedStreamReader:
+    """Чтение двоичного потока через mmap без создания объекта на каждую запись"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+        self.records: Optional[np.ndarray] = None
+
+    def __enter__(self):
+        self._file = open(self.filename, 'rb')
+        try:
+            return self._load()
+        except BaseException:
+            # __exit__ не вызывается, если __enter__ упал: закрываем файл и отображение сами
+            self.__exit__(None, None, None)
+            raise
+
+    def _load(self) -> 'PackedStreamReader':
+        header = self._file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{self.filename}: file is too short")
+        magic, version, kind, width, count = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.filename}: unsupported file format")
+        self.kind = RecordKind(kind)
+        self.width = width
+        dtype = _record_dtype(width)
+        if count == 0:
+            self.records = np.zeros((0, 2), dtype=dtype)
+            return self
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size + count * 2 * width:
+            raise ValueError(f"{self.filename}: file is truncated")
+        # Представление над отображенной памятью, данные не копируются
+        self.records = np.frombuffer(self._map, dtype=dtype, count=count * 2,
+                                     offset=HEADER.size).reshape(count, 2)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.records = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Снаружи еще живут представления: память освободится вместе с ними
+                pass
+            self._map = None
+        self._file.close()
+        self._file = None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def first(self) -> np.ndarray:
+        """Столбец x (или dx) как представление без копирования"""
+        return self.records[:, 0]
+
+    @property
+    def second(self) -> np.ndarray:
+        """Столбец y (или dy) как представление без копирования"""
+        return self.records[:, 1]
+
+    def points(self, start: int = 0, stop: Optional[int] = None) -> ScreenPointArray:
+        """Диапазон записей как ScreenPointArray (с пакетной проверкой границ)"""
+        if self.kind is not RecordKind.POINT:
+            raise TypeError("File does not contain points")
+        return ScreenPointArray(self.first[start:stop], self.second[start:stop])
+
+    def vectors(self, start: int = 0, stop: Optional[int] = None) -> ScreenVectorArray:
+        """Диапазон записей как ScreenVectorArray"""
+        if self.kind is not RecordKind.VECTOR:
+            raise TypeError("File does not contain vectors")
+        return ScreenVectorArray(self.first[start:stop], self.second[start:stop])
+
+
+def demonstrate_binary_format(filename: Optional[str] = None):
+    """Демонстрация записи и чтения траектории; по умолчанию файл пишется во временный каталог"""
+    filename = filename or os.path.join(tempfile.gettempdir(), "trajectory.spv")
+    trajectory = ScreenPointArray(np.arange(0, 1000, 10), np.arange(0, 500, 5))
+    with PackedStreamWriter(filename, RecordKind.POINT, width=2) as writer:
+        writer.write(trajectory)
+        writer.write([ScreenPoint(1920, 1080)])
+
+    with PackedStreamReader(filename) as reader:
+        print(f"Записей: {len(reader)}, тип: {reader.kind.name}, байт на компоненту: {reader.width}")
+        print(f"Первые точки: {reader.points(0, 3).to_points()}")
+        print(f"Последняя точка: {reader.points(-1).to_points()}")
+
+
+if __name__ == "__main__":
+    demonstrate_binary_format()
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+
+# Коды областей для алгоритма Коэна-Сазерленда
+INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
+
+
+class ClipMethod(Enum):
+    LIANG_BARSKY = 'liang_barsky'
+    COHEN_SUTHERLAND = 'cohen_sutherland'
+
+
+@dataclass
+class ClippedSegments:
+    """Видимые части отрезков и маска того, какие исходные отрезки видны"""
+    starts: ScreenPointArray
+    ends: ScreenPointArray
+    visible: np.ndarray
+
+    @property
+    def vectors(self) -> ScreenVectorArray:
+        return ScreenVectorArray.between(self.starts, self.ends)
+
+
+def _liang_barsky(x0: np.ndarray, y0: np.ndarray, dx: np.ndarray, dy: np.ndarray,
+                  left=0, bottom=0, right=SCREEN_WIDTH, top=SCREEN_HEIGHT):
+    """Концы видимой части и маска видимости для всех отрезков сразу
+
+    Границы прямоугольника включительны; это числа или массивы - свой
+    прямоугольник для каждого отрезка. По умолчанию - весь экран.
+    """
+    t0 = np.zeros(len(x0))
+    t1 = np.ones(len(x0))
+    visible = np.ones(len(x0), dtype=bool)
+    for p, q in ((-dx, x0 - left), (dx, right - x0), (-dy, y0 - bottom), (dy, top - y0)):
+        parallel = p == 0
+        visible &= ~(parallel & (q < 0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = q / p
+        entering = p < 0
+        leaving = p > 0
+        t0 = np.where(entering, np.maximum(t0, ratio), t0)
+        t1 = np.where(leaving, np.minimum(t1, ratio), t1)
+    visible &= t0 <= t1
+    return x0 + t0 * dx, y0 + t0 * dy, x0 + t1 * dx, y0 + t1 * dy, visible
+
+
+def _outcode(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    code = np.zeros(len(x), dtype=np.int8)
+    code[x < 0] |= LEFT
+    code[x > SCREEN_WIDTH] |= RIGHT
+    code[y < 0] |= BOTTOM
+    code[y > SCREEN_HEIGHT] |= TOP
+    return code
+
+
+def _cohen_sutherland(x0: np.ndarray, y0: np.ndarray, dx: np.ndarray, dy: np.ndarray):
+    """Пакетный Коэн-Сазерленд: за итерацию переносится один внешний конец каждого отрезка"""
+    x0, y0 = x0.copy(), y0.copy()
+    x1, y1 = x0 + dx, y0 + dy
+    code0, code1 = _outcode(x0, y0), _outcode(x1, y1)
+    visible = np.zeros(len(x0), dtype=bool)
+    active = np.ones(len(x0), dtype=bool)
+
+    while active.any():
+        accepted = active & ((code0 | code1) == 0)
+        visible |= accepted
+        active &= ~accepted & ((code0 & code1) == 0)
+        if not active.any():
+            break
+
+        index = np.nonzero(active)[0]
+        use_first = code0[index] != 0
+        code = np.where(use_first, code0[index], code1[index])
+        ax, ay = x0[index], y0[index]
+        bx, by = x1[index], y1[index]
+        # Внешний конец переносится на первую по приоритету нарушенную границу
+        edge_bit = np.where(code & TOP, TOP, np.where(code & BOTTOM, BOTTOM,
+                                                      np.where(code & RIGHT, RIGHT, LEFT)))
+        horizontal_edge = (edge_bit == TOP) | (edge_bit == BOTTOM)
+        edge = np.select([edge_bit == TOP, edge_bit == RIGHT], [SCREEN_HEIGHT, SCREEN_WIDTH], 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_on_edge = ax + (bx - ax) * (edge - ay) / (by - ay)
+            y_on_edge = ay + (by - ay) * (edge - ax) / (bx - ax)
+        new_x = np.where(horizontal_edge, x_on_edge, edge)
+        new_y = np.where(horizontal_edge, edge, y_on_edge)
+
+        first, second = index[use_first], index[~use_first]
+        x0[first], y0[first] = new_x[use_first], new_y[use_first]
+        x1[second], y1[second] = new_x[~use_first], new_y[~use_first]
+        code0[first] = _outcode(x0[first], y0[first])
+        code1[second] = _outcode(x1[second], y1[second])
+
+    return x0, y0, x1, y1, visible
+
+
+def clip_segments(x0: Iterable[int], y0: Iterable[int],
+                  vectors: Union[ScreenVectorArray, Tuple[Iterable[int], Iterable[int]]],
+                  method: Union[ClipMethod, str] = ClipMethod.LIANG_BARSKY) -> ClippedSegments:
+    """Отсекает отрезки (x0, y0) + vector прямоугольником экрана без исключений
+
+    Начала отрезков могут лежать за пределами экрана; концы видимых частей
+    округляются до целых пикселей внутри экрана.
+    """
+    x0 = np.asarray(x0, dtype=np.float64)
+    y0 = np.asarray(y0, dtype=np.float64)
+    if not isinstance(vectors, ScreenVectorArray):
+        vectors = ScreenVectorArray(*vectors)
+    if len(vectors) != len(x0) or len(y0) != len(x0):
+        raise ValueError("Segment origins and vectors must have the same length")
+    dx = vectors.dx.astype(np.float64)
+    dy = vectors.dy.astype(np.float64)
+
+    if ClipMethod(method) is ClipMethod.LIANG_BARSKY:
+        sx, sy, ex, ey, visible = _liang_barsky(x0, y0, dx, dy)
+    else:
+        sx, sy, ex, ey, visible = _cohen_sutherland(x0, y0, dx, dy)
+
+    def to_pixels(values: np.ndarray, max_value: int) -> np.ndarray:
+        return np.clip(np.rint(values[visible]), 0, max_value).astype(np.int32)
+
+    starts = ScreenPointArray._from_trusted(to_pixels(sx, SCREEN_WIDTH), to_pixels(sy, SCREEN_HEIGHT))
+    ends = ScreenPointArray._from_trusted(to_pixels(ex, SCREEN_WIDTH), to_pixels(ey, SCREEN_HEIGHT))
+    return ClippedSegments(starts, ends, visible)
+
+
+def demonstrate_clipping():
+    """Демонстрация отсечения отрезков границами экрана"""
+    x0 = [-100, 100, 2000, 960]
+    y0 = [540, 100, 2000, 540]
+    vectors = ScreenVectorArray([2200, 50, 10, 0], [0, 50, 10, 1000])
+    for method in ClipMethod:
+        clipped = clip_segments(x0, y0, vectors, method)
+        print(f"{method.value}: видимы {clipped.visible}, "
+              f"начала {clipped.starts.to_points()}, концы {clipped.ends.to_points()}")
+
+
+if __name__ == "__main__":
+    demonstrate_clipping()
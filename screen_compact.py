@@ -0,0 +1,180 @@
+from math import sqrt
+from typing import Iterator, Union
+
+from oop1laba import (FIXED_POINT_BITS, SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint, ScreenVector,
+                      fixed_point_direction)
+
+AnyPoint = Union[ScreenPoint, 'CompactScreenPoint']
+AnyVector = Union[ScreenVector, 'CompactScreenVector']
+
+
+class CompactScreenPoint:
+    """Точка на экране без __dict__ (хранение в __slots__) с проверкой границ"""
+
+    __slots__ = ('_x', '_y')
+
+    _validate_coordinate = staticmethod(ScreenPoint._validate_coordinate)
+
+    def __init__(self, x: int, y: int):
+        self._x = self._validate_coordinate(x, SCREEN_WIDTH, 'x')
+        self._y = self._validate_coordinate(y, SCREEN_HEIGHT, 'y')
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = self._validate_coordinate(value, SCREEN_WIDTH, 'x')
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = self._validate_coordinate(value, SCREEN_HEIGHT, 'y')
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactScreenPoint, ScreenPoint)):
+            return False
+        return self._x == other.x and self._y == other.y
+
+    def __str__(self) -> str:
+        return f"Point(x={self._x}, y={self._y})"
+
+    def __repr__(self) -> str:
+        return f"CompactScreenPoint({self._x}, {self._y})"
+
+
+class CompactScreenVector:
+    """2D вектор на экране без __dict__ (хранение в __slots__)"""
+
+    __slots__ = ('_dx', '_dy')
+
+    def __init__(self, dx: int = None, dy: int = None,
+                 start: AnyPoint = None, end: AnyPoint = None):
+        if start is not None and end is not None:
+            self._dx = end.x - start.x
+            self._dy = end.y - start.y
+        elif dx is not None and dy is not None:
+            self._dx = dx
+            self._dy = dy
+        else:
+            raise ValueError("Vector must be initialized with either (dx, dy) or (start, end)")
+
+    @property
+    def dx(self) -> int:
+        return self._dx
+
+    @property
+    def dy(self) -> int:
+        return self._dy
+
+    def __getitem__(self, index: int) -> int:
+        if index == 0:
+            return self._dx
+        elif index == 1:
+            return self._dy
+        raise IndexError("Vector index out of range (0-1)")
+
+    def __setitem__(self, index: int, value: int) -> None:
+        if index == 0:
+            self._dx = value
+        elif index == 1:
+            self._dy = value
+        else:
+            raise IndexError("Vector index out of range (0-1)")
+
+    def __iter__(self) -> Iterator[int]:
+        yield self._dx
+        yield self._dy
+
+    def __len__(self) -> int:
+        return 2
+
+    def magnitude(self) -> float:
+        """Возвращает длину вектора"""
+        return sqrt(self._dx ** 2 + self._dy ** 2)
+
+    def __abs__(self) -> float:
+        return self.magnitude()
+
+    def squared_magnitude(self) -> int:
+        """Квадрат длины без sqrt: для целых компонент результат точный"""
+        return self._dx * self._dx + self._dy * self._dy
+
+    def compare_magnitude(self, other: AnyVector) -> int:
+        """Сравнивает длины по квадратам: -1, 0 или 1"""
+        first, second = self.squared_magnitude(), other.squared_magnitude()
+        return (first > second) - (first < second)
+
+    def normalized_fixed(self, bits: int = FIXED_POINT_BITS) -> 'CompactScreenVector':
+        """Единичное направление в фиксированной точке: компоненты ~ round(d / |v| * 2**bits)"""
+        return CompactScreenVector(*fixed_point_direction(self._dx, self._dy, bits))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactScreenVector, ScreenVector)):
+            return False
+        return self._dx == other.dx and self._dy == other.dy
+
+    def __str__(self) -> str:
+        return f"Vector(dx={self._dx}, dy={self._dy})"
+
+    def __repr__(self) -> str:
+        return f"CompactScreenVector({self._dx}, {self._dy})"
+
+    # Арифметические операции
+    def __add__(self, other: AnyVector) -> 'CompactScreenVector':
+        if not isinstance(other, (CompactScreenVector, ScreenVector)):
+            raise TypeError("Can only add ScreenVector to another ScreenVector")
+        return CompactScreenVector(dx=self._dx + other.dx, dy=self._dy + other.dy)
+
+    def __sub__(self, other: AnyVector) -> 'CompactScreenVector':
+        if not isinstance(other, (CompactScreenVector, ScreenVector)):
+            raise TypeError("Can only subtract ScreenVector from another ScreenVector")
+        return CompactScreenVector(dx=self._dx - other.dx, dy=self._dy - other.dy)
+
+    def __mul__(self, scalar: int) -> 'CompactScreenVector':
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only multiply by scalar (int or float)")
+        return CompactScreenVector(dx=self._dx * scalar, dy=self._dy * scalar)
+
+    def __truediv__(self, scalar: int) -> 'CompactScreenVector':
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only divide by scalar (int or float)")
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return CompactScreenVector(dx=self._dx / scalar, dy=self._dy / scalar)
+
+    def __floordiv__(self, scalar: int) -> 'CompactScreenVector':
+        """Целочисленное деление: компоненты остаются int (в отличие от /)"""
+        if isinstance(scalar, bool) or not isinstance(scalar, int):
+            raise TypeError("Can only floor-divide by integer scalar")
+        if scalar == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return CompactScreenVector(dx=self._dx // scalar, dy=self._dy // scalar)
+
+    # Векторные операции
+    def dot_product(self, other: AnyVector) -> int:
+        """Скалярное произведение векторов"""
+        return self._dx * other.dx + self._dy * other.dy
+
+    @classmethod
+    def dot(cls, v1: AnyVector, v2: AnyVector) -> int:
+        """Статический метод скалярного произведения"""
+        return v1.dot_product(v2)
+
+    def cross_product(self, other: AnyVector) -> int:
+        """Векторное произведение векторов (псевдоскаляр)"""
+        return self._dx * other.dy - self._dy * other.dx
+
+    @classmethod
+    def cross(cls, v1: AnyVector, v2: AnyVector) -> int:
+        """Статический метод векторного произведения"""
+        return v1.cross_product(v2)
+
+    @classmethod
+    def triple_product(cls, v1: AnyVector, v2: AnyVector, v3: AnyVector) -> int:
+        """Смешанное произведение трех векторов"""
+        return v1.cross_product(v2) * v3.dx + v1.cross_product(v2) * v3.dy
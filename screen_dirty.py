@@ -0,0 +1,167 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from oop4lab import IPropertyObserver
+from screen_observable import ObservableScreenPoint
+from screen_rect import ScreenRect
+
+
+class IRegionRenderer(ABC):
+    @abstractmethod
+    def redraw(self, regions: List[ScreenRect]) -> None:
+        """Перерисовывает только переданные области экрана"""
+        pass
+
+
+# Стоимость слияния: (область, массив областей) -> стоимость объединения области с каждой из них;
+# области заданы как (x_min, y_min, x_max, y_max) включительно
+MergeCost = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def wasted_area_cost(box: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Сколько лишних пикселей придется перерисовать, если объединить box с каждой из others"""
+    def pixels(x_min, y_min, x_max, y_max):
+        return np.maximum(x_max - x_min + 1, 0) * np.maximum(y_max - y_min + 1, 0)
+
+    union = pixels(np.minimum(box[0], others[:, 0]), np.minimum(box[1], others[:, 1]),
+                   np.maximum(box[2], others[:, 2]), np.maximum(box[3], others[:, 3]))
+    overlap = pixels(np.maximum(box[0], others[:, 0]), np.maximum(box[1], others[:, 1]),
+                     np.minimum(box[2], others[:, 2]), np.minimum(box[3], others[:, 3]))
+    covered = pixels(*box) + pixels(others[:, 0], others[:, 1], others[:, 2], others[:, 3]) - overlap
+    return union - covered
+
+
+class DirtyRegionTracker(IPropertyObserver):
+    """Собирает изменившиеся области и сводит их к небольшому набору прямоугольников
+
+    Два прямоугольника объединяются, если стоимость слияния merge_cost
+    (по умолчанию лишняя площадь объединения) не больше rect_overhead -
+    условной стоимости отдельной перерисовки одного прямоугольника.
+    """
+
+    def __init__(self, point_radius: int = 2, rect_overhead: int = 1024, max_rects: Optional[int] = 64,
+                 merge_cost: MergeCost = wasted_area_cost):
+        if max_rects is not None and max_rects < 1:
+            raise ValueError("max_rects must be at least 1")
+        self.point_radius = point_radius
+        self.rect_overhead = rect_overhead
+        self.max_rects = max_rects
+        self.merge_cost = merge_cost
+        self._dirty: List[ScreenRect] = []
+        self._positions: Dict[int, Tuple[int, int]] = {}
+
+    # Отслеживание точек
+    def track(self, point: ObservableScreenPoint) -> None:
+        """Подписывается на сеттеры x/y точки; старое и новое место станут грязными"""
+        self._positions[id(point)] = (point.x, point.y)
+        point.subscribe_observer(self)
+
+    def untrack(self, point: ObservableScreenPoint) -> None:
+        self._positions.pop(id(point), None)
+        point.unsubscribe_observer(self)
+
+    # Реализация интерфейса IPropertyObserver
+    def property_updated(self, source: Any, prop_name: str) -> None:
+        old_position = self._positions.get(id(source))
+        if old_position is None:
+            return
+        self._mark_xy(*old_position)
+        self._mark_xy(source.x, source.y)
+        self._positions[id(source)] = (source.x, source.y)
+
+    # Явная пометка изменений
+    def _mark_xy(self, x: int, y: int) -> None:
+        radius = self.point_radius
+        region = ScreenRect.clamped(x - radius, y - radius, x + radius, y + radius)
+        if region is not None:
+            self._dirty.append(region)
+
+    def mark_point(self, point: ScreenPoint) -> None:
+        self._mark_xy(point.x, point.y)
+
+    def mark_segment(self, start: ScreenPoint, end: ScreenPoint) -> None:
+        radius = self.point_radius
+        region = ScreenRect.clamped(min(start.x, end.x) - radius, min(start.y, end.y) - radius,
+                                    max(start.x, end.x) + radius, max(start.y, end.y) + radius)
+        if region is not None:
+            self._dirty.append(region)
+
+    def mark_rect(self, rect: ScreenRect) -> None:
+        self._dirty.append(rect)
+
+    def __len__(self) -> int:
+        return len(self._dirty)
+
+    # Слияние
+    def _merge_pass(self, boxes: np.ndarray, overhead: int) -> np.ndarray:
+        """Жадное слияние: каждая область сливается с той, где стоимость слияния минимальна"""
+        merged = np.empty((len(boxes), 4), dtype=np.int64)
+        count = 0
+        # Крупные области первыми: мелкие чаще поглощаются ими целиком
+        sizes = (boxes[:, 2] - boxes[:, 0] + 1) * (boxes[:, 3] - boxes[:, 1] + 1)
+        for box in boxes[np.argsort(-sizes, kind='stable')]:
+            while True:
+                costs = self.merge_cost(box, merged[:count])
+                best = int(np.argmin(costs)) if count else -1
+                if best < 0 or costs[best] > overhead:
+                    merged[count] = box
+                    count += 1
+                    break
+                # Объединенная область может теперь выгодно сливаться с другими
+                other = merged[best].copy()
+                box = np.concatenate((np.minimum(box[:2], other[:2]), np.maximum(box[2:], other[2:])))
+                count -= 1
+                merged[best] = merged[count]
+        return merged[:count]
+
+    def _merge(self, regions: List[ScreenRect]) -> List[ScreenRect]:
+        if not regions:
+            return []
+        boxes = np.array([(r.x_min, r.y_min, r.x_max, r.y_max) for r in regions], dtype=np.int64)
+        overhead = self.rect_overhead
+        boxes = self._merge_pass(boxes, overhead)
+        # Слишком много областей: повышаем допустимую стоимость слияния, пока не уложимся
+        while self.max_rects is not None and len(boxes) > self.max_rects:
+            overhead = max(2 * overhead, 1)
+            boxes = self._merge_pass(boxes, overhead)
+        return [ScreenRect(*box) for box in boxes.tolist()]
+
+    def pending(self) -> List[ScreenRect]:
+        """Текущий объединенный набор грязных областей без сброса"""
+        return self._merge(self._dirty)
+
+    def flush(self, renderer: Optional[IRegionRenderer] = None) -> List[ScreenRect]:
+        """Возвращает объединенные области, передает их рендереру и очищает накопленное"""
+        regions = self._merge(self._dirty)
+        self._dirty = []
+        if renderer is not None and regions:
+            renderer.redraw(regions)
+        return regions
+
+
+class ConsoleRegionRenderer(IRegionRenderer):
+    def redraw(self, regions: List[ScreenRect]) -> None:
+        pixels = sum(r.pixel_count for r in regions)
+        print(f"[REDRAW] {len(regions)} областей, {pixels} пикселей: {', '.join(map(str, regions))}")
+
+
+def demonstrate_dirty_tracking():
+    """Демонстрация инкрементальной перерисовки"""
+    tracker = DirtyRegionTracker(point_radius=3)
+    handles = [ObservableScreenPoint(100 + 10 * i, 100) for i in range(5)]
+    for handle in handles:
+        tracker.track(handle)
+
+    for handle in handles:
+        handle.y = 110
+    handles[0].x = 1500
+    tracker.mark_segment(ScreenPoint(800, 800), ScreenPoint(820, 790))
+    tracker.flush(ConsoleRegionRenderer())
+    print(f"После сброса: {tracker.flush()}")
+
+
+if __name__ == "__main__":
+    demonstrate_dirty_tracking()
@@ -0,0 +1,201 @@
+import sys
+import tracemalloc
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+
+
+class FrozenScreenPoint(ScreenPoint):
+    """Неизменяемая хешируемая точка экрана; безопасна для совместного использования"""
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # hasattr, а не self.__dict__: обращение к __dict__ создает словарь у каждого экземпляра
+        if name in ('_x', '_y') and hasattr(self, name):
+            raise AttributeError("FrozenScreenPoint is immutable")
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        return ScreenPoint.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
+    def __repr__(self) -> str:
+        return f"FrozenScreenPoint({self._x}, {self._y})"
+
+
+@lru_cache(maxsize=None)
+def _instance_size() -> int:
+    """Сколько памяти на самом деле занимает один FrozenScreenPoint (замер tracemalloc)"""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # Малые int кэшируются интерпретатором, поэтому считаются только сами точки
+        points = [FrozenScreenPoint(i % 256, 0) for i in range(1000)]
+        allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(points)
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return max(allocated // len(points), 0)
+
+
+@dataclass
+class InternStats:
+    """Статистика кэша: каждое попадание - одна несозданная и непроверенная точка"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    instance_bytes: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+    @property
+    def allocations_saved(self) -> int:
+        return self.hits
+
+    @property
+    def bytes_saved(self) -> int:
+        """Сколько памяти заняли бы точки, если бы каждое обращение создавало новую"""
+        return self.hits * self.instance_bytes
+
+    def __str__(self) -> str:
+        return (f"запросов {self.requests}, попаданий {self.hit_rate:.1%}, "
+                f"сэкономлено {self.allocations_saved} объектов (~{self.bytes_saved / 2 ** 20:.1f} МБ), "
+                f"в кэше {self.size}, вытеснено {self.evictions}")
+
+
+class PointInternCache:
+    """Кэш-приспособленец для FrozenScreenPoint
+
+    Точки на сетке grid_step (если задан) хранятся в заранее выделенной
+    таблице и не вытесняются; остальные - в LRU не больше max_size штук.
+    Одинаковые координаты возвращают один и тот же экземпляр, проверка
+    границ выполняется только при первом создании.
+    """
+
+    def __init__(self, max_size: int = 4096, grid_step: Optional[int] = None):
+        if max_size < 0:
+            raise ValueError("Cache size must not be negative")
+        if grid_step is not None and grid_step < 1:
+            raise ValueError("Grid step must be positive")
+        self.max_size = max_size
+        self.grid_step = grid_step
+        self._lru: 'OrderedDict[tuple, FrozenScreenPoint]' = OrderedDict()
+        self._grid: List[Optional[FrozenScreenPoint]] = []
+        self._grid_columns = 0
+        if grid_step is not None:
+            self._grid_columns = SCREEN_WIDTH // grid_step + 1
+            self._grid = [None] * (self._grid_columns * (SCREEN_HEIGHT // grid_step + 1))
+        self._grid_size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._instance_bytes = 0
+
+    def get(self, x: int, y: int) -> FrozenScreenPoint:
+        # Только настоящие int: 1.0 == 1, но точка из float должна вызывать TypeError
+        if type(x) is not int or type(y) is not int:
+            return FrozenScreenPoint(x, y)
+
+        step = self.grid_step
+        if step is not None and x % step == 0 and y % step == 0 and 0 <= x <= SCREEN_WIDTH and 0 <= y <= SCREEN_HEIGHT:
+            slot = (y // step) * self._grid_columns + x // step
+            point = self._grid[slot]
+            if point is None:
+                point = self._create(x, y)
+                self._grid[slot] = point
+                self._grid_size += 1
+            else:
+                self._hits += 1
+            return point
+
+        key = (x, y)
+        point = self._lru.get(key)
+        if point is not None:
+            self._hits += 1
+            self._lru.move_to_end(key)
+            return point
+        point = self._create(x, y)
+        if self.max_size:
+            self._lru[key] = point
+            if len(self._lru) > self.max_size:
+                self._lru.popitem(last=False)
+                self._evictions += 1
+        return point
+
+    def _create(self, x: int, y: int) -> FrozenScreenPoint:
+        point = FrozenScreenPoint(x, y)
+        self._misses += 1
+        if not self._instance_bytes:
+            self._instance_bytes = _instance_size()
+        return point
+
+    def __call__(self, x: int, y: int) -> FrozenScreenPoint:
+        return self.get(x, y)
+
+    def __len__(self) -> int:
+        return len(self._lru) + self._grid_size
+
+    @property
+    def stats(self) -> InternStats:
+        return InternStats(self._hits, self._misses, self._evictions, len(self), self._instance_bytes)
+
+    def reset_stats(self) -> None:
+        self._hits = self._misses = self._evictions = 0
+
+    def clear(self) -> None:
+        self._lru.clear()
+        self._grid = [None] * len(self._grid)
+        self._grid_size = 0
+        self.reset_stats()
+
+
+# Общий кэш модуля
+default_cache = PointInternCache()
+
+
+def intern_point(x: int, y: int) -> FrozenScreenPoint:
+    """Общий экземпляр точки (x, y) из кэша модуля"""
+    return default_cache.get(x, y)
+
+
+def demonstrate_interning():
+    """Демонстрация повторного использования точек сетки разметки"""
+    import random
+
+    cache = PointInternCache(max_size=1024, grid_step=8)
+    rng = random.Random(0)
+    layout = []
+    for _ in range(1_000_000):
+        # В основном узлы сетки 8 px, изредка произвольные пиксели
+        if rng.random() < 0.95:
+            layout.append(cache(8 * rng.randrange(0, 241), 8 * rng.randrange(0, 136)))
+        else:
+            layout.append(cache(rng.randrange(0, 1921), rng.randrange(0, 1081)))
+    print(f"Уникальных объектов: {len({id(p) for p in layout})} на {len(layout)} использований")
+    print(f"Статистика: {cache.stats}")
+    print(f"Хешируемость: {len(set(layout[:1000]))} различных точек среди первых 1000")
+
+
+if __name__ == "__main__":
+    demonstrate_interning()
@@ -0,0 +1,168 @@
+import heapq
+from typing import List, Tuple
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from screen_arrays import PointSet, as_point_array
+
+
+class ScreenKDTree:
+    """KD-дерево над точками экрана для поиска k ближайших соседей
+
+    Все сравнения ведутся по квадрату расстояния в целых числах, без sqrt.
+    """
+
+    def __init__(self, points: PointSet, leaf_size: int = 16):
+        if leaf_size <= 0:
+            raise ValueError("Leaf size must be positive")
+        self.points = as_point_array(points)
+        self.leaf_size = leaf_size
+
+        coords = np.column_stack((self.points.x, self.points.y)).astype(np.int64)
+        order = np.arange(len(self.points))
+        # Узлы хранятся в параллельных списках: для листа left == -1
+        self._split_dim: List[int] = []
+        self._split_val: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._start: List[int] = []
+        self._end: List[int] = []
+        if len(order):
+            self._build(coords, order, 0, len(order))
+
+        # Координаты в порядке листьев для быстрого перебора в Python
+        self._order = order.tolist()
+        self._px = coords[order, 0].tolist()
+        self._py = coords[order, 1].tolist()
+
+    def _new_node(self, start: int, end: int) -> int:
+        self._split_dim.append(0)
+        self._split_val.append(0)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._start.append(start)
+        self._end.append(end)
+        return len(self._left) - 1
+
+    def _build(self, coords: np.ndarray, order: np.ndarray, start: int, end: int) -> int:
+        node = self._new_node(start, end)
+        if end - start <= self.leaf_size:
+            return node
+
+        segment = coords[order[start:end]]
+        spread = segment.max(axis=0) - segment.min(axis=0)
+        dim = int(np.argmax(spread))
+        if spread[dim] == 0:
+            return node
+
+        mid = (end - start) // 2
+        partition = np.argpartition(segment[:, dim], mid)
+        order[start:end] = order[start:end][partition]
+        self._split_dim[node] = dim
+        self._split_val[node] = int(coords[order[start + mid], dim])
+        self._left[node] = self._build(coords, order, start, start + mid)
+        self._right[node] = self._build(coords, order, start + mid, end)
+        return node
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _search(self, qx: int, qy: int, k: int) -> List[Tuple[int, int]]:
+        """Возвращает k пар (квадрат расстояния, индекс), отсортированных по возрастанию"""
+        heap: List[Tuple[int, int]] = []  # max-куча по (d2, index) через отрицание
+        px, py, order = self._px, self._py, self._order
+        split_dim, split_val = self._split_dim, self._split_val
+        left, right, starts, ends = self._left, self._right, self._start, self._end
+
+        # Стек (узел, нижняя оценка квадрата расстояния до его области)
+        stack = [(0, 0)] if left else []
+        while stack:
+            node, bound = stack.pop()
+            if len(heap) == k and bound > -heap[0][0]:
+                continue
+            if left[node] == -1:
+                for i in range(starts[node], ends[node]):
+                    dx = px[i] - qx
+                    dy = py[i] - qy
+                    item = (-(dx * dx + dy * dy), -order[i])
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+                continue
+
+            diff = (qx if split_dim[node] == 0 else qy) - split_val[node]
+            near, far = (right[node], left[node]) if diff >= 0 else (left[node], right[node])
+            # Дальний потомок кладется первым, чтобы ближний обработать раньше
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))
+
+        return sorted((-d, -i) for d, i in heap)
+
+    def query(self, point: ScreenPoint, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Квадраты расстояний и индексы k ближайших точек"""
+        if k <= 0:
+            raise ValueError("k must be positive")
+        found = self._search(point.x, point.y, min(k, len(self)))
+        distances = np.array([d for d, _ in found], dtype=np.int64)
+        indices = np.array([i for _, i in found], dtype=np.int64)
+        return distances, indices
+
+    def query_batch(self, queries: PointSet, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Пакетный поиск: массивы (n_queries, k) квадратов расстояний и индексов"""
+        if k <= 0:
+            raise ValueError("k must be positive")
+        queries = as_point_array(queries)
+        k = min(k, len(self))
+        distances = np.empty((len(queries), k), dtype=np.int64)
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        for row, (qx, qy) in enumerate(zip(queries.x.tolist(), queries.y.tolist())):
+            found = self._search(qx, qy, k)
+            distances[row] = [d for d, _ in found]
+            indices[row] = [i for _, i in found]
+        return distances, indices
+
+    def nearest(self, point: ScreenPoint, k: int = 1) -> List[ScreenPoint]:
+        """k ближайших точек в виде ScreenPoint"""
+        _, indices = self.query(point, k)
+        return [self.points[int(i)] for i in indices]
+
+
+def brute_force_knn(points: PointSet, queries: PointSet, k: int = 1,
+                    max_block: int = 1 << 22) -> Tuple[np.ndarray, np.ndarray]:
+    """Эталонный полный перебор (векторизованный, порциями не больше max_block элементов)"""
+    points = as_point_array(points)
+    queries = as_point_array(queries)
+    n = len(points)
+    k = min(k, n)
+    px = points.x.astype(np.int64)
+    py = points.y.astype(np.int64)
+    distances = np.empty((len(queries), k), dtype=np.int64)
+    indices = np.empty((len(queries), k), dtype=np.int64)
+    chunk = max(1, max_block // max(n, 1))
+
+    for start in range(0, len(queries), chunk):
+        qx = queries.x[start:start + chunk, None].astype(np.int64)
+        qy = queries.y[start:start + chunk, None].astype(np.int64)
+        # Ключ (расстояние, индекс) в одном int64 - тот же порядок, что и в KD-дереве
+        key = ((px - qx) ** 2 + (py - qy) ** 2) * n + np.arange(n)
+        if k < n:
+            key = np.partition(key, k - 1, axis=1)[:, :k]
+        key.sort(axis=1)
+        distances[start:start + chunk] = key // n
+        indices[start:start + chunk] = key % n
+    return distances, indices
+
+
+def demonstrate_knn():
+    """Демонстрация поиска ближайших соседей"""
+    anchors = [ScreenPoint(x, y) for x in range(0, 1920, 120) for y in range(0, 1080, 120)]
+    tree = ScreenKDTree(anchors)
+    cursor = ScreenPoint(500, 500)
+    print(f"3 ближайшие к {cursor}: {tree.nearest(cursor, 3)}")
+    print(f"Квадраты расстояний и индексы: {tree.query(cursor, 3)}")
+
+
+if __name__ == "__main__":
+    demonstrate_knn()
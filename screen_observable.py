@@ -0,0 +1,51 @@
+from typing import List
+
+from oop1laba import ScreenPoint
+from oop4lab import IObservableProperties, IPropertyObserver
+
+
+class ObservableScreenPoint(ScreenPoint, IObservableProperties):
+    """Точка на экране, уведомляющая наблюдателей об изменении x/y"""
+
+    def __init__(self, x: int, y: int):
+        super().__init__(x, y)
+        self._observers: List[IPropertyObserver] = []
+
+    # Реализация интерфейса IObservableProperties
+    def subscribe_observer(self, observer: IPropertyObserver) -> None:
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def unsubscribe_observer(self, observer: IPropertyObserver) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    # Свойства с проверкой границ и уведомлением
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        old_value = self._x
+        ScreenPoint.x.fset(self, value)
+        if self._x != old_value:
+            self._notify("x")
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        old_value = self._y
+        ScreenPoint.y.fset(self, value)
+        if self._y != old_value:
+            self._notify("y")
+
+    def _notify(self, prop_name: str) -> None:
+        for observer in list(self._observers):
+            observer.property_updated(self, prop_name)
+
+    def __repr__(self) -> str:
+        return f"ObservableScreenPoint({self._x}, {self._y})"
@@ -0,0 +1,161 @@
+from enum import Enum
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+
+Operand = Union[ScreenVectorArray, ScreenPointArray]
+Block = Tuple[int, int, np.ndarray]
+
+# Размер одного блока результата по умолчанию (64 МиБ)
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+class DistanceMetric(Enum):
+    EUCLIDEAN = 'euclidean'
+    SQUARED = 'sqeuclidean'
+    MANHATTAN = 'manhattan'
+    CHEBYSHEV = 'chebyshev'
+
+
+def _raw_components(operand: Operand) -> Tuple[np.ndarray, np.ndarray]:
+    """Собственные массивы операнда без копирования: для векторов (dx, dy), для точек (x, y)"""
+    if isinstance(operand, ScreenVectorArray):
+        return operand.dx, operand.dy
+    if isinstance(operand, ScreenPointArray):
+        return operand.x, operand.y
+    raise TypeError("Operands must be ScreenVectorArray or ScreenPointArray")
+
+
+def _components(operand: Operand) -> Tuple[np.ndarray, np.ndarray]:
+    """Компоненты в int64/float64: для векторов (dx, dy), для точек (x, y)"""
+    first, second = _raw_components(operand)
+    if first.dtype.kind == 'f':
+        return first, second
+    return first.astype(np.int64), second.astype(np.int64)
+
+
+def _dot(ax, ay, bx, by) -> np.ndarray:
+    return ax * bx + ay * by
+
+
+def _cross(ax, ay, bx, by) -> np.ndarray:
+    return ax * by - ay * bx
+
+
+def _squared(ax, ay, bx, by) -> np.ndarray:
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+def _euclidean(ax, ay, bx, by) -> np.ndarray:
+    return np.hypot(ax - bx, ay - by)
+
+
+def _manhattan(ax, ay, bx, by) -> np.ndarray:
+    return np.abs(ax - bx) + np.abs(ay - by)
+
+
+def _chebyshev(ax, ay, bx, by) -> np.ndarray:
+    return np.maximum(np.abs(ax - bx), np.abs(ay - by))
+
+
+_DISTANCE_KERNELS: Dict[DistanceMetric, Callable] = {
+    DistanceMetric.EUCLIDEAN: _euclidean,
+    DistanceMetric.SQUARED: _squared,
+    DistanceMetric.MANHATTAN: _manhattan,
+    DistanceMetric.CHEBYSHEV: _chebyshev,
+}
+
+
+def _block_rows(columns: int, max_block_bytes: int) -> int:
+    """Сколько строк результата помещается в один блок (8 байт на элемент)"""
+    return max(1, max_block_bytes // (8 * max(columns, 1)))
+
+
+def _iter_blocks(kernel: Callable, a: Operand, b: Operand, max_block_bytes: int) -> Iterator[Block]:
+    ax, ay = _components(a)
+    bx, by = _components(b)
+    rows = _block_rows(len(bx), max_block_bytes)
+    for start in range(0, len(ax), rows):
+        end = min(start + rows, len(ax))
+        yield start, end, kernel(ax[start:end, None], ay[start:end, None], bx, by)
+
+
+def _collect(blocks: Iterator[Block], shape: Tuple[int, int], dtype,
+             out: Optional[np.ndarray]) -> np.ndarray:
+    """Складывает блоки в out (например, np.memmap) или в новый массив"""
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"Output array must have shape {shape}")
+    for start, end, block in blocks:
+        out[start:end] = block
+    return out
+
+
+def _result_dtype(a: Operand, b: Operand, floating: bool = False):
+    # Нужен только dtype, поэтому без приведения к int64
+    if floating or _raw_components(a)[0].dtype.kind == 'f' or _raw_components(b)[0].dtype.kind == 'f':
+        return np.float64
+    return np.int64
+
+
+def iter_pairwise_dot(a: Operand, b: Operand,
+                      max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> Iterator[Block]:
+    """Блоки (start, end, rows) матрицы скалярных произведений"""
+    return _iter_blocks(_dot, a, b, max_block_bytes)
+
+
+def iter_pairwise_cross(a: Operand, b: Operand,
+                        max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> Iterator[Block]:
+    """Блоки (start, end, rows) матрицы векторных произведений"""
+    return _iter_blocks(_cross, a, b, max_block_bytes)
+
+
+def iter_pairwise_distance(a: Operand, b: Operand,
+                           metric: Union[DistanceMetric, str] = DistanceMetric.EUCLIDEAN,
+                           max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> Iterator[Block]:
+    """Блоки (start, end, rows) матрицы расстояний"""
+    return _iter_blocks(_DISTANCE_KERNELS[DistanceMetric(metric)], a, b, max_block_bytes)
+
+
+def pairwise_dot(a: Operand, b: Operand, out: Optional[np.ndarray] = None,
+                 max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """Матрица скалярных произведений всех пар a[i], b[j]"""
+    return _collect(iter_pairwise_dot(a, b, max_block_bytes),
+                    (len(a), len(b)), _result_dtype(a, b), out)
+
+
+def pairwise_cross(a: Operand, b: Operand, out: Optional[np.ndarray] = None,
+                   max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """Матрица векторных произведений всех пар a[i], b[j]"""
+    return _collect(iter_pairwise_cross(a, b, max_block_bytes),
+                    (len(a), len(b)), _result_dtype(a, b), out)
+
+
+def pairwise_distance(a: Operand, b: Operand,
+                      metric: Union[DistanceMetric, str] = DistanceMetric.EUCLIDEAN,
+                      out: Optional[np.ndarray] = None,
+                      max_block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """Матрица расстояний всех пар a[i], b[j] в выбранной метрике"""
+    metric = DistanceMetric(metric)
+    dtype = _result_dtype(a, b, floating=metric is DistanceMetric.EUCLIDEAN)
+    return _collect(iter_pairwise_distance(a, b, metric, max_block_bytes),
+                    (len(a), len(b)), dtype, out)
+
+
+def demonstrate_pairwise():
+    """Демонстрация попарных матриц"""
+    a = ScreenVectorArray([1, 0, 3], [0, 1, 4])
+    b = ScreenVectorArray([2, -1], [2, 5])
+    print(f"Скалярные произведения:\n{pairwise_dot(a, b)}")
+    print(f"Векторные произведения:\n{pairwise_cross(a, b)}")
+    for metric in DistanceMetric:
+        print(f"{metric.value}:\n{pairwise_distance(a, b, metric)}")
+
+
+if __name__ == "__main__":
+    demonstrate_pairwise()
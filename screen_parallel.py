@@ -0,0 +1,207 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from screen_arrays import ScreenPointArray
+from screen_polygon import points_in_polygon
+from screen_transform import AffineTransform
+
+
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Описание массива в разделяемой памяти; передается воркерам вместо данных"""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+# Функция-задача: (начало, конец, входные массивы, выходной массив, параметры)
+ChunkTask = Callable[[int, int, Dict[str, np.ndarray], np.ndarray, dict], None]
+
+
+def _attach(spec: SharedArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    # Воркеры пула делят resource_tracker с родителем, который и удаляет блок
+    block = shared_memory.SharedMemory(name=spec.name)
+    return block, np.ndarray(spec.shape, dtype=spec.dtype, buffer=block.buf)
+
+
+def _run_chunk(task: ChunkTask, start: int, end: int, inputs: Dict[str, SharedArraySpec],
+               output: SharedArraySpec, params: dict) -> None:
+    """Выполняется в воркере: подключает разделяемые массивы и считает свой диапазон"""
+    blocks = []
+    try:
+        arrays = {}
+        for key, spec in inputs.items():
+            block, arrays[key] = _attach(spec)
+            blocks.append(block)
+        block, out = _attach(output)
+        blocks.append(block)
+        task(start, end, arrays, out, params)
+        del arrays, out
+    finally:
+        for block in blocks:
+            block.close()
+
+
+class SharedMemoryExecutor:
+    """Пул процессов для пакетной геометрии над массивами в разделяемой памяти
+
+    Входные массивы копируются в multiprocessing.shared_memory, воркеры
+    получают только имена блоков и диапазоны индексов, а результаты пишут
+    прямо в общий выходной буфер - объекты точек не сериализуются.
+
+    Блоки, созданные внутри map_chunks, освобождаются по окончании вызова.
+    Блоки из share()/allocate() принадлежат вызывающему: их можно передавать
+    во многие вызовы и освобождать через release() (или при выходе из with).
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunks_per_worker: int = 4):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+    def __enter__(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._pool.shutdown()
+        self._pool = None
+        for name in list(self._blocks):
+            self._release_block(name)
+
+    def allocate(self, shape: Tuple[int, ...], dtype) -> SharedArraySpec:
+        """Новый массив в разделяемой памяти; например, выходной буфер для нескольких вызовов"""
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        self._blocks[block.name] = block
+        return SharedArraySpec(block.name, tuple(shape), dtype.str)
+
+    def view(self, spec: SharedArraySpec) -> np.ndarray:
+        """Массив numpy поверх блока без копирования (действителен до release)"""
+        return np.ndarray(spec.shape, dtype=spec.dtype, buffer=self._blocks[spec.name].buf)
+
+    def share(self, array: np.ndarray) -> SharedArraySpec:
+        """Копирует массив в разделяемую память, чтобы переиспользовать его в нескольких вызовах"""
+        array = np.ascontiguousarray(array)
+        spec = self.allocate(array.shape, array.dtype)
+        self.view(spec)[...] = array
+        return spec
+
+    def release(self, spec: SharedArraySpec) -> None:
+        """Освобождает блок из share()/allocate()"""
+        self._release_block(spec.name)
+
+    def _release_block(self, name: str) -> None:
+        block = self._blocks.pop(name)
+        try:
+            block.close()
+        except BufferError:
+            # Снаружи еще живет view(); отображение закроется вместе с ним
+            pass
+        block.unlink()
+
+    def map_chunks(self, task: ChunkTask, inputs: Dict[str, Union[np.ndarray, SharedArraySpec]], length: int,
+                   out_shape: Tuple[int, ...], out_dtype, params: dict = None,
+                   out: Optional[SharedArraySpec] = None) -> np.ndarray:
+        """Делит диапазон [0, length) между воркерами и собирает результат в один массив
+
+        task должна быть функцией верхнего уровня модуля (ее передают воркерам по имени)
+        и писать только в out[start:end]. Если out задан (из allocate), результат
+        пишется туда и возвращается view без копирования; иначе возвращается
+        обычный массив, а временный блок освобождается.
+        """
+        if self._pool is None:
+            raise ValueError("Executor must be used as a context manager")
+        temporary: List[SharedArraySpec] = []
+        try:
+            specs = {}
+            for key, value in inputs.items():
+                if not isinstance(value, SharedArraySpec):
+                    value = self.share(value)
+                    temporary.append(value)
+                specs[key] = value
+            out_spec = out
+            if out_spec is None:
+                out_spec = self.allocate(out_shape, out_dtype)
+                temporary.append(out_spec)
+            elif out_spec.shape != tuple(out_shape) or np.dtype(out_spec.dtype) != np.dtype(out_dtype):
+                raise ValueError("Output buffer shape or dtype does not match the task")
+
+            chunk = max(1, -(-length // (self.workers * self.chunks_per_worker)))
+            futures = [self._pool.submit(_run_chunk, task, start, min(start + chunk, length),
+                                         specs, out_spec, params or {})
+                       for start in range(0, length, chunk)]
+            for future in futures:
+                future.result()
+            return self.view(out_spec) if out is not None else self.view(out_spec).copy()
+        finally:
+            for spec in temporary:
+                self.release(spec)
+
+
+# Готовые задачи
+def _transform_task(start: int, end: int, inputs: Dict[str, np.ndarray], out: np.ndarray, params: dict) -> None:
+    transform = AffineTransform(params['matrix'])
+    x, y = transform.apply_xy(inputs['x'][start:end], inputs['y'][start:end])
+    out[start:end, 0] = np.rint(x)
+    out[start:end, 1] = np.rint(y)
+
+
+def _distance_task(start: int, end: int, inputs: Dict[str, np.ndarray], out: np.ndarray, params: dict) -> None:
+    dx = inputs['x'][start:end].astype(np.int64) - params['x']
+    dy = inputs['y'][start:end].astype(np.int64) - params['y']
+    out[start:end] = dx * dx + dy * dy
+
+
+def _polygon_task(start: int, end: int, inputs: Dict[str, np.ndarray], out: np.ndarray, params: dict) -> None:
+    polygon = ScreenPointArray._from_trusted(inputs['polygon_x'], inputs['polygon_y'])
+    queries = ScreenPointArray._from_trusted(inputs['x'][start:end], inputs['y'][start:end])
+    out[start:end] = points_in_polygon(polygon, queries)
+
+
+def parallel_transform(executor: SharedMemoryExecutor, transform: AffineTransform,
+                       points: ScreenPointArray) -> Tuple[np.ndarray, np.ndarray]:
+    """Аффинное преобразование с округлением до пикселя; проверка границ остается за вызывающим"""
+    result = executor.map_chunks(_transform_task, {'x': points.x, 'y': points.y}, len(points),
+                                 (len(points), 2), np.int64, {'matrix': transform.matrix})
+    return result[:, 0], result[:, 1]
+
+
+def parallel_squared_distances(executor: SharedMemoryExecutor, points: ScreenPointArray,
+                               origin_x: int, origin_y: int) -> np.ndarray:
+    """Квадраты расстояний от всех точек до (origin_x, origin_y)"""
+    return executor.map_chunks(_distance_task, {'x': points.x, 'y': points.y}, len(points),
+                               (len(points),), np.int64, {'x': origin_x, 'y': origin_y})
+
+
+def parallel_points_in_polygon(executor: SharedMemoryExecutor, polygon: ScreenPointArray,
+                               points: ScreenPointArray) -> np.ndarray:
+    """Принадлежность точек многоугольнику (например, выпуклой оболочке)"""
+    inputs = {'x': points.x, 'y': points.y, 'polygon_x': polygon.x, 'polygon_y': polygon.y}
+    return executor.map_chunks(_polygon_task, inputs, len(points), (len(points),), np.bool_)
+
+
+def demonstrate_parallel_executor():
+    """Демонстрация параллельной обработки большого пакета точек"""
+    rng = np.random.default_rng(0)
+    points = ScreenPointArray(rng.integers(0, 1921, 2_000_000), rng.integers(0, 1081, 2_000_000))
+    hull = ScreenPointArray([200, 1700, 960], [100, 100, 1000])
+    with SharedMemoryExecutor() as executor:
+        inside = parallel_points_in_polygon(executor, hull, points)
+        distances = parallel_squared_distances(executor, points, 960, 540)
+        x, y = parallel_transform(executor, AffineTransform().scale(0.5), points)
+    print(f"Воркеров: {executor.workers}")
+    print(f"Внутри треугольника: {int(inside.sum())} из {len(points)}")
+    print(f"Ближайшая к центру: квадрат расстояния {int(distances.min())}")
+    print(f"После масштабирования: x до {int(x.max())}, y до {int(y.max())}")
+
+
+if __name__ == "__main__":
+    demonstrate_parallel_executor()
@@ -0,0 +1,158 @@
+from typing import Tuple
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from screen_arrays import PointSet, ScreenPointArray, ScreenVectorArray, as_point_array
+
+
+def orientation(a: ScreenPointArray, b: ScreenPointArray, c: ScreenPointArray) -> np.ndarray:
+    """Знак cross(b - a, c - a) для каждой тройки: 1, -1 или 0 (коллинеарны)"""
+    ab = ScreenVectorArray.between(a, b)
+    ac = ScreenVectorArray.between(a, c)
+    return np.sign(ab.cross_product(ac)).astype(np.int8)
+
+
+def _cross(ox: int, oy: int, ax: int, ay: int, bx: int, by: int) -> int:
+    """ScreenVector.cross для векторов o->a и o->b без создания объектов"""
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def _discard_interior(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Отбрасывает точки внутри четырехугольника крайних точек (эвристика Акла-Туссена)"""
+    extremes = [int(np.argmin(x + y)), int(np.argmax(x - y)),
+                int(np.argmax(x + y)), int(np.argmin(x - y))]
+    qx = x[extremes].astype(np.int64)
+    qy = y[extremes].astype(np.int64)
+    px = x.astype(np.int64)
+    py = y.astype(np.int64)
+    strictly_inside = np.ones(len(x), dtype=bool)
+    for i in range(4):
+        j = (i + 1) % 4
+        side = (qx[j] - qx[i]) * (py - qy[i]) - (qy[j] - qy[i]) * (px - qx[i])
+        strictly_inside &= side > 0
+    keep = ~strictly_inside
+    return x[keep], y[keep]
+
+
+def convex_hull(points: PointSet) -> ScreenPointArray:
+    """Выпуклая оболочка (монотонная цепочка Эндрю), O(n log n)
+
+    Вершины возвращаются в порядке положительного cross без коллинеарных точек.
+    """
+    points = as_point_array(points)
+    x, y = points.x, points.y
+    if len(x) > 64:
+        x, y = _discard_interior(x, y)
+
+    order = np.lexsort((y, x))
+    xs = x[order].tolist()
+    ys = y[order].tolist()
+    unique = [(px, py) for i, (px, py) in enumerate(zip(xs, ys))
+              if i == 0 or (px, py) != (xs[i - 1], ys[i - 1])]
+    if len(unique) < 3:
+        hull = unique
+    else:
+        lower = []
+        for px, py in unique:
+            while len(lower) >= 2 and _cross(*lower[-2], *lower[-1], px, py) <= 0:
+                lower.pop()
+            lower.append((px, py))
+        upper = []
+        for px, py in reversed(unique):
+            while len(upper) >= 2 and _cross(*upper[-2], *upper[-1], px, py) <= 0:
+                upper.pop()
+            upper.append((px, py))
+        hull = lower[:-1] + upper[:-1]
+
+    hull_x = np.array([px for px, _ in hull], dtype=np.int32)
+    hull_y = np.array([py for _, py in hull], dtype=np.int32)
+    return ScreenPointArray._from_trusted(hull_x, hull_y)
+
+
+def _edge_vectors(polygon: ScreenPointArray) -> ScreenVectorArray:
+    """Ребра многоугольника как векторы из каждой вершины в следующую"""
+    return ScreenVectorArray.between(polygon, polygon[np.roll(np.arange(len(polygon)), -1)])
+
+
+def signed_area(polygon: PointSet) -> float:
+    """Ориентированная площадь (формула шнурков через cross соседних вершин)"""
+    polygon = as_point_array(polygon)
+    if len(polygon) < 3:
+        return 0.0
+    vertices = ScreenVectorArray(polygon.x, polygon.y)
+    following = vertices[np.roll(np.arange(len(polygon)), -1)]
+    return float(vertices.cross_product(following).sum()) / 2
+
+
+def polygon_area(polygon: PointSet) -> float:
+    """Площадь простого многоугольника"""
+    return abs(signed_area(polygon))
+
+
+def polygon_centroid(polygon: PointSet) -> Tuple[float, float]:
+    """Центр масс простого многоугольника"""
+    polygon = as_point_array(polygon)
+    if len(polygon) == 0:
+        raise ValueError("Polygon must have at least one vertex")
+    vertices = ScreenVectorArray(polygon.x, polygon.y)
+    following = vertices[np.roll(np.arange(len(polygon)), -1)]
+    cross = vertices.cross_product(following)
+    doubled_area = cross.sum()
+    if doubled_area == 0:
+        # Вырожденный многоугольник: среднее вершин
+        return float(polygon.x.mean()), float(polygon.y.mean())
+    cx = ((vertices.dx.astype(np.int64) + following.dx) * cross).sum() / (3 * doubled_area)
+    cy = ((vertices.dy.astype(np.int64) + following.dy) * cross).sum() / (3 * doubled_area)
+    return float(cx), float(cy)
+
+
+def points_in_polygon(polygon: PointSet, queries: PointSet, chunk_size: int = 1 << 20) -> np.ndarray:
+    """Пакетная проверка принадлежности точек многоугольнику (граница считается внутри)"""
+    polygon = as_point_array(polygon)
+    queries = as_point_array(queries)
+    result = np.zeros(len(queries), dtype=bool)
+    if len(polygon) == 0:
+        return result
+
+    edges = _edge_vectors(polygon)
+    ex0 = polygon.x.astype(np.int64).tolist()
+    ey0 = polygon.y.astype(np.int64).tolist()
+    edx = edges.dx.astype(np.int64).tolist()
+    edy = edges.dy.astype(np.int64).tolist()
+
+    for begin in range(0, len(queries), chunk_size):
+        qx = queries.x[begin:begin + chunk_size].astype(np.int64)
+        qy = queries.y[begin:begin + chunk_size].astype(np.int64)
+        inside = np.zeros(len(qx), dtype=bool)
+        on_edge = np.zeros(len(qx), dtype=bool)
+        for x0, y0, dx, dy in zip(ex0, ey0, edx, edy):
+            # cross(ребро, вектор от начала ребра к точке)
+            cross = dx * (qy - y0) - dy * (qx - x0)
+            y1 = y0 + dy
+            # Правило четности: ребро пересекает горизонтальный луч вправо от точки
+            if dy > 0:
+                inside ^= (y0 <= qy) & (qy < y1) & (cross > 0)
+            elif dy < 0:
+                inside ^= (y1 <= qy) & (qy < y0) & (cross < 0)
+            x1 = x0 + dx
+            on_edge |= ((cross == 0) & (min(x0, x1) <= qx) & (qx <= max(x0, x1))
+                        & (min(y0, y1) <= qy) & (qy <= max(y0, y1)))
+        result[begin:begin + chunk_size] = inside | on_edge
+    return result
+
+
+def demonstrate_polygon_toolkit():
+    """Демонстрация выпуклой оболочки и операций с многоугольником"""
+    cloud = [ScreenPoint(x, y) for x, y in
+             [(100, 100), (300, 120), (200, 200), (400, 400), (120, 380), (250, 300)]]
+    hull = convex_hull(cloud)
+    print(f"Выпуклая оболочка: {hull.to_points()}")
+    print(f"Площадь: {polygon_area(hull)}, центр масс: {polygon_centroid(hull)}")
+    probes = [ScreenPoint(200, 200), ScreenPoint(10, 10), ScreenPoint(100, 100)]
+    print(f"Внутри: {points_in_polygon(hull, probes)}")
+    print(f"Ориентация первых трех вершин: {orientation(hull[:1], hull[1:2], hull[2:3])}")
+
+
+if __name__ == "__main__":
+    demonstrate_polygon_toolkit()
@@ -0,0 +1,191 @@
+import os
+import tempfile
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+
+
+def line_pixels(starts: ScreenPointArray, vectors: ScreenVectorArray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Пакетный Брезенхем: (x, y, номер отрезка) всех пикселей всех отрезков одним проходом numpy
+
+    Для шага i по главной оси смещение по второй оси равно
+    round(i * d_minor / steps) - то же, что дает целочисленный Брезенхем.
+    """
+    if len(starts) != len(vectors):
+        raise ValueError("starts and vectors must have the same length")
+    if vectors.dx.dtype.kind == 'f':
+        vectors = ScreenVectorArray(np.rint(vectors.dx).astype(np.int64),
+                                    np.rint(vectors.dy).astype(np.int64))
+    x0 = starts.x.astype(np.int64)
+    y0 = starts.y.astype(np.int64)
+    dx = vectors.dx.astype(np.int64)
+    dy = vectors.dy.astype(np.int64)
+    steps = np.maximum(np.abs(dx), np.abs(dy))
+
+    # Номер шага i для каждого пикселя каждого отрезка
+    counts = steps + 1
+    line = np.repeat(np.arange(len(counts)), counts)
+    first_pixel = np.cumsum(counts) - counts
+    step = np.arange(counts.sum()) - first_pixel[line]
+
+    divisor = 2 * np.maximum(steps, 1)[line]
+
+    def offset(delta: np.ndarray) -> np.ndarray:
+        delta = delta[line]
+        rounded = (2 * step * np.abs(delta) + divisor // 2) // divisor
+        return np.sign(delta) * rounded
+
+    return x0[line] + offset(dx), y0[line] + offset(dy), line
+
+
+class Framebuffer:
+    """Заранее выделенный 8-битный кадр на весь экран поверх bytearray
+
+    Размер кадра (SCREEN_WIDTH + 1) x (SCREEN_HEIGHT + 1), чтобы вместить все
+    допустимые координаты ScreenPoint, включая правую и нижнюю границы.
+    Без копирования содержимое доступно как массив numpy (pixels) и как
+    memoryview (buffer); оба смотрят в один и тот же bytearray.
+    """
+
+    def __init__(self, background: int = 0):
+        self.width = SCREEN_WIDTH + 1
+        self.height = SCREEN_HEIGHT + 1
+        self._buffer = bytearray(self.width * self.height)
+        # Представление numpy над тем же bytearray, данные не копируются
+        self.pixels = np.frombuffer(self._buffer, dtype=np.uint8).reshape(self.height, self.width)
+        if background:
+            self.clear(background)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Двумерный memoryview (строки x столбцы) над кадром"""
+        return memoryview(self._buffer).cast('B', (self.height, self.width))
+
+    def clear(self, value: int = 0) -> None:
+        self.pixels.fill(value)
+
+    def set_pixel(self, point: ScreenPoint, value: int = 255) -> None:
+        self.pixels[point.y, point.x] = value
+
+    def _plot(self, x: np.ndarray, y: np.ndarray, value: int) -> None:
+        """Рисует только пиксели внутри кадра"""
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        self.pixels[y[inside], x[inside]] = value
+
+    def draw_lines(self, starts: ScreenPointArray, vectors: ScreenVectorArray, value: int = 255) -> None:
+        """Рисует отрезки пакетным Брезенхемом (см. line_pixels)
+
+        Части отрезков за пределами экрана отбрасываются.
+        """
+        x, y, _ = line_pixels(starts, vectors)
+        self._plot(x, y, value)
+
+    def draw_rect(self, x_min: int, y_min: int, x_max: int, y_max: int,
+                  value: int = 255, filled: bool = False) -> None:
+        """Прямоугольник с границами включительно, обрезанный по кадру"""
+        x_min, x_max = max(min(x_min, x_max), 0), min(max(x_min, x_max), self.width - 1)
+        y_min, y_max = max(min(y_min, y_max), 0), min(max(y_min, y_max), self.height - 1)
+        if x_min > x_max or y_min > y_max:
+            return
+        if filled:
+            self.pixels[y_min:y_max + 1, x_min:x_max + 1] = value
+            return
+        self.pixels[y_min, x_min:x_max + 1] = value
+        self.pixels[y_max, x_min:x_max + 1] = value
+        self.pixels[y_min:y_max + 1, x_min] = value
+        self.pixels[y_min:y_max + 1, x_max] = value
+
+    def fill_polygon(self, polygon: Union[ScreenPointArray, list], value: int = 255) -> None:
+        """Заливка многоугольника по правилу четности, граница включительно
+
+        Пиксель закрашен, если его центр внутри многоугольника или на границе -
+        как в points_in_polygon и draw_rect(filled=True).
+        """
+        if not isinstance(polygon, ScreenPointArray):
+            polygon = ScreenPointArray.from_points(polygon)
+        if len(polygon) < 3:
+            return
+        x0 = polygon.x.astype(np.int64)
+        y0 = polygon.y.astype(np.int64)
+        following = np.roll(np.arange(len(polygon)), -1)
+        x1 = x0[following]
+        y1 = y0[following]
+
+        # Граница, которую не дают пары пересечений: вершины и горизонтальные ребра
+        flat = y0 == y1
+        span_rows = [y0, y0[flat]]
+        span_starts = [x0, np.minimum(x0, x1)[flat]]
+        span_ends = [x0, np.maximum(x0, x1)[flat]]
+
+        rows, numerators, denominators = [], [], []
+        for ax, ay, bx, by in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()):
+            if ay == by:
+                continue
+            if ay > by:
+                ax, ay, bx, by = bx, by, ax, ay
+            # Полуоткрытый диапазон строк [ay, by), как в points_in_polygon
+            scanlines = np.arange(ay, by)
+            rows.append(scanlines)
+            # Пересечение x = numerator / (by - ay) точно в целых числах
+            numerators.append(ax * (by - ay) + (scanlines - ay) * (bx - ax))
+            denominators.append(np.full(len(scanlines), by - ay))
+        if rows:
+            rows = np.concatenate(rows)
+            numerators = np.concatenate(numerators)
+            denominators = np.concatenate(denominators)
+            order = np.lexsort((numerators / denominators, rows))
+            numerators = numerators[order].reshape(-1, 2)
+            denominators = denominators[order].reshape(-1, 2)
+            span_rows.append(rows[order].reshape(-1, 2)[:, 0])
+            span_starts.append(-(-numerators[:, 0] // denominators[:, 0]))
+            span_ends.append(numerators[:, 1] // denominators[:, 1])
+
+        rows = np.concatenate(span_rows)
+        start = np.concatenate(span_starts)
+        end = np.concatenate(span_ends)
+        visible = (start <= end) & (rows >= 0) & (rows < self.height)
+        rows = rows[visible]
+        start = np.clip(start[visible], 0, None)
+        end = np.clip(end[visible], None, self.width - 1)
+        visible = start <= end
+        if not visible.any():
+            return
+        rows, start, end = rows[visible], start[visible], end[visible]
+
+        # Разностный массив только по ограничивающему прямоугольнику видимых отрезков:
+        # +1 в начале отрезка, -1 после конца
+        row_min, row_max = int(rows.min()), int(rows.max())
+        col_min, col_max = int(start.min()), int(end.max())
+        coverage = np.zeros((row_max - row_min + 1, col_max - col_min + 2), dtype=np.int32)
+        np.add.at(coverage, (rows - row_min, start - col_min), 1)
+        np.add.at(coverage, (rows - row_min, end + 1 - col_min), -1)
+        region = self.pixels[row_min:row_max + 1, col_min:col_max + 1]
+        region[np.cumsum(coverage, axis=1)[:, :-1] > 0] = value
+
+    def save_pgm(self, filename: str) -> None:
+        """Сохраняет кадр в формате PGM для отладки"""
+        with open(filename, 'wb') as image:
+            image.write(f"P5 {self.width} {self.height} 255\n".encode('ascii'))
+            image.write(self._buffer)
+
+
+def demonstrate_rasterizer(filename: Optional[str] = None):
+    """Демонстрация отрисовки отладочного слоя; по умолчанию файл пишется во временный каталог"""
+    filename = filename or os.path.join(tempfile.gettempdir(), "overlay.pgm")
+    frame = Framebuffer()
+    starts = ScreenPointArray([0, 0, 960], [0, 1080, 540])
+    vectors = ScreenVectorArray([1920, 1920, 300], [1080, -1080, -100])
+    frame.draw_lines(starts, vectors, 255)
+    frame.draw_rect(100, 100, 400, 300, 128)
+    frame.fill_polygon([ScreenPoint(1200, 200), ScreenPoint(1600, 300), ScreenPoint(1400, 700)], 200)
+    print(f"Закрашено пикселей: {int(np.count_nonzero(frame.pixels))}")
+    print(f"Буфер: {frame.buffer.shape}, {frame.buffer.nbytes} байт")
+    frame.save_pgm(filename)
+    print(f"Слой сохранен в {filename}")
+
+
+if __name__ == "__main__":
+    demonstrate_rasterizer()
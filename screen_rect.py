@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+
+
+@dataclass(frozen=True)
+class ScreenRect:
+    """Прямоугольник на экране с проверкой границ (стороны включительно)"""
+    x_min: int
+    y_min: int
+    x_max: int
+    y_max: int
+
+    def __post_init__(self):
+        ScreenPoint._validate_coordinate(self.x_min, SCREEN_WIDTH, 'x_min')
+        ScreenPoint._validate_coordinate(self.x_max, SCREEN_WIDTH, 'x_max')
+        ScreenPoint._validate_coordinate(self.y_min, SCREEN_HEIGHT, 'y_min')
+        ScreenPoint._validate_coordinate(self.y_max, SCREEN_HEIGHT, 'y_max')
+        if self.x_min > self.x_max or self.y_min > self.y_max:
+            raise ValueError("Rectangle minimum corner must not exceed maximum corner")
+
+    @classmethod
+    def from_points(cls, first: ScreenPoint, second: ScreenPoint) -> 'ScreenRect':
+        """Наименьший прямоугольник, содержащий две точки"""
+        return cls(min(first.x, second.x), min(first.y, second.y),
+                   max(first.x, second.x), max(first.y, second.y))
+
+    @classmethod
+    def clamped(cls, x_min: int, y_min: int, x_max: int, y_max: int) -> Optional['ScreenRect']:
+        """Видимая часть произвольного прямоугольника или None, если он вне экрана"""
+        x_min, y_min = max(x_min, 0), max(y_min, 0)
+        x_max, y_max = min(x_max, SCREEN_WIDTH), min(y_max, SCREEN_HEIGHT)
+        if x_min > x_max or y_min > y_max:
+            return None
+        return cls(x_min, y_min, x_max, y_max)
+
+    @property
+    def width(self) -> int:
+        return self.x_max - self.x_min
+
+    @property
+    def height(self) -> int:
+        return self.y_max - self.y_min
+
+    @property
+    def area(self) -> int:
+        return self.width * self.height
+
+    @property
+    def pixel_count(self) -> int:
+        """Число пикселей, покрываемых прямоугольником"""
+        return (self.width + 1) * (self.height + 1)
+
+    def contains(self, point: ScreenPoint) -> bool:
+        return self.x_min <= point.x <= self.x_max and self.y_min <= point.y <= self.y_max
+
+    def __contains__(self, point: ScreenPoint) -> bool:
+        return self.contains(point)
+
+    def intersects(self, other: 'ScreenRect') -> bool:
+        return (self.x_min <= other.x_max and other.x_min <= self.x_max
+                and self.y_min <= other.y_max and other.y_min <= self.y_max)
+
+    def intersection(self, other: 'ScreenRect') -> Optional['ScreenRect']:
+        """Общая часть прямоугольников или None"""
+        if not self.intersects(other):
+            return None
+        return ScreenRect(max(self.x_min, other.x_min), max(self.y_min, other.y_min),
+                          min(self.x_max, other.x_max), min(self.y_max, other.y_max))
+
+    def union(self, other: 'ScreenRect') -> 'ScreenRect':
+        """Наименьший прямоугольник, содержащий оба"""
+        return ScreenRect(min(self.x_min, other.x_min), min(self.y_min, other.y_min),
+                          max(self.x_max, other.x_max), max(self.y_max, other.y_max))
+
+    def __and__(self, other: 'ScreenRect') -> Optional['ScreenRect']:
+        return self.intersection(other)
+
+    def __or__(self, other: 'ScreenRect') -> 'ScreenRect':
+        return self.union(other)
+
+    def __str__(self) -> str:
+        return f"Rect(({self.x_min}, {self.y_min})-({self.x_max}, {self.y_max}))"
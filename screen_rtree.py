@@ -0,0 +1,120 @@
+from math import ceil, sqrt
+from typing import List, Sequence
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from screen_rect import ScreenRect
+
+
+def _str_order(boxes: np.ndarray, capacity: int) -> np.ndarray:
+    """Порядок Sort-Tile-Recursive: полосы по центру x, внутри полосы - по центру y"""
+    count = len(boxes)
+    leaves = ceil(count / capacity)
+    slices = ceil(sqrt(leaves))
+    slice_size = slices * capacity
+    center_x = boxes[:, 0] + boxes[:, 2]
+    center_y = boxes[:, 1] + boxes[:, 3]
+    by_x = np.argsort(center_x, kind='stable')
+    # Номер полосы для каждого элемента, затем сортировка по (полоса, центр y)
+    band = np.empty(count, dtype=np.int64)
+    band[by_x] = np.arange(count) // slice_size
+    return np.lexsort((center_y, band))
+
+
+def _expand(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Объединение диапазонов [starts[i], ends[i]) в один массив индексов"""
+    counts = ends - starts
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) - np.repeat(offsets - starts, counts)
+
+
+class ScreenRTree:
+    """Упакованное R-дерево над прямоугольниками экрана (массовая загрузка STR)
+
+    Каждый уровень хранится массивами numpy, поэтому запросы обходят дерево
+    по уровням векторно, а не по одному узлу.
+    """
+
+    def __init__(self, rects: Sequence[ScreenRect], node_capacity: int = 16):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        self.rects = list(rects)
+        self.node_capacity = node_capacity
+
+        boxes = np.array([(r.x_min, r.y_min, r.x_max, r.y_max) for r in self.rects],
+                         dtype=np.int32).reshape(-1, 4)
+        order = _str_order(boxes, node_capacity) if len(boxes) else np.zeros(0, dtype=np.int64)
+        self._ids = order
+        # _levels[0] - прямоугольники, далее узлы; у узла дети - диапазон уровня ниже
+        self._levels: List[np.ndarray] = [boxes[order]]
+        self._children: List[np.ndarray] = [np.zeros((0, 2), dtype=np.int64)]
+
+        while len(self._levels[-1]) > node_capacity:
+            below = self._levels[-1]
+            starts = np.arange(0, len(below), node_capacity)
+            ends = np.minimum(starts + node_capacity, len(below))
+            nodes = np.column_stack((
+                np.minimum.reduceat(below[:, 0], starts), np.minimum.reduceat(below[:, 1], starts),
+                np.maximum.reduceat(below[:, 2], starts), np.maximum.reduceat(below[:, 3], starts),
+            ))
+            # Узлы верхнего уровня тоже упорядочиваются STR, диапазоны детей едут вместе с ними
+            node_order = _str_order(nodes, node_capacity)
+            self._levels.append(nodes[node_order])
+            self._children.append(np.column_stack((starts, ends))[node_order])
+
+    @classmethod
+    def bulk_load(cls, rects: Sequence[ScreenRect], node_capacity: int = 16) -> 'ScreenRTree':
+        return cls(rects, node_capacity)
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    @property
+    def height(self) -> int:
+        return len(self._levels)
+
+    def _search(self, x_min: int, y_min: int, x_max: int, y_max: int) -> np.ndarray:
+        """Индексы исходных прямоугольников, пересекающих заданную область"""
+        candidates = np.arange(len(self._levels[-1]))
+        for level in range(len(self._levels) - 1, -1, -1):
+            boxes = self._levels[level][candidates]
+            hit = ((boxes[:, 0] <= x_max) & (boxes[:, 2] >= x_min)
+                   & (boxes[:, 1] <= y_max) & (boxes[:, 3] >= y_min))
+            candidates = candidates[hit]
+            if level > 0:
+                children = self._children[level][candidates]
+                candidates = _expand(children[:, 0], children[:, 1])
+        return np.sort(self._ids[candidates])
+
+    def query(self, rect: ScreenRect) -> np.ndarray:
+        """Индексы прямоугольников, пересекающих rect (касание считается пересечением)"""
+        return self._search(rect.x_min, rect.y_min, rect.x_max, rect.y_max)
+
+    def stab(self, point: ScreenPoint) -> np.ndarray:
+        """Индексы прямоугольников, содержащих точку"""
+        return self._search(point.x, point.y, point.x, point.y)
+
+    def stab_rects(self, point: ScreenPoint) -> List[ScreenRect]:
+        return [self.rects[i] for i in self.stab(point)]
+
+    def query_rects(self, rect: ScreenRect) -> List[ScreenRect]:
+        return [self.rects[i] for i in self.query(rect)]
+
+
+def demonstrate_rtree():
+    """Демонстрация проверки попадания по набору перекрывающихся областей"""
+    rng = np.random.default_rng(0)
+    corners = rng.integers(0, [1800, 1000], size=(50_000, 2))
+    sizes = rng.integers(1, 80, size=(50_000, 2))
+    widgets = [ScreenRect(int(x), int(y), int(x + w), int(y + h))
+               for (x, y), (w, h) in zip(corners, sizes)]
+    tree = ScreenRTree.bulk_load(widgets)
+    cursor = ScreenPoint(960, 540)
+    print(f"Областей: {len(tree)}, высота дерева: {tree.height}")
+    print(f"Под курсором {cursor}: {len(tree.stab(cursor))} областей")
+    print(f"Пересекают {ScreenRect(0, 0, 100, 100)}: {len(tree.query(ScreenRect(0, 0, 100, 100)))}")
+
+
+if __name__ == "__main__":
+    demonstrate_rtree()
@@ -0,0 +1,219 @@
+import heapq
+from dataclasses import dataclass
+from fractions import Fraction
+from math import lcm
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from oop1laba import ScreenPoint, ScreenVector
+
+Number = Union[int, Fraction]
+EventPoint = Tuple[Number, Number]
+
+
+@dataclass(frozen=True)
+class SegmentIntersection:
+    """Точка пересечения и индексы всех отрезков, проходящих через нее"""
+    x: Number
+    y: Number
+    segments: Tuple[int, ...]
+
+
+class _Segment:
+    """Отрезок, ориентированный слева направо (при равном x - снизу вверх)"""
+
+    __slots__ = ('index', 'x1', 'y1', 'x2', 'y2', 'dx', 'dy')
+
+    def __init__(self, index: int, start: ScreenPoint, end: ScreenPoint):
+        first, second = (start.x, start.y), (end.x, end.y)
+        if second < first:
+            first, second = second, first
+        self.index = index
+        self.x1, self.y1 = first
+        self.x2, self.y2 = second
+        self.dx = self.x2 - self.x1
+        self.dy = self.y2 - self.y1
+
+    @property
+    def left(self) -> EventPoint:
+        return self.x1, self.y1
+
+    @property
+    def right(self) -> EventPoint:
+        return self.x2, self.y2
+
+    def side_of(self, x: int, y: int, d: int) -> int:
+        """Знак (высота отрезка на прямой X = x/d) - y/d; вертикальный отрезок идет вместе с событием"""
+        if self.dx == 0:
+            return 0
+        # Обе части умножены на d * dx > 0, чтобы остаться в целых числах
+        diff = self.y1 * self.dx * d + (x - self.x1 * d) * self.dy - y * self.dx
+        return (diff > 0) - (diff < 0)
+
+    def slope_key(self) -> Tuple[int, Number]:
+        """Порядок сразу правее точки события: по наклону, вертикальные в конце"""
+        if self.dx == 0:
+            return 1, 0
+        return 0, Fraction(self.dy, self.dx)
+
+
+def _intersection(a: _Segment, b: _Segment) -> Optional[EventPoint]:
+    """Точная точка пересечения двух непараллельных отрезков (через cross)"""
+    denominator = a.dx * b.dy - a.dy * b.dx
+    if denominator == 0:
+        return None
+    qx = b.x1 - a.x1
+    qy = b.y1 - a.y1
+    t_numerator = qx * b.dy - qy * b.dx
+    u_numerator = qx * a.dy - qy * a.dx
+    if denominator < 0:
+        denominator, t_numerator, u_numerator = -denominator, -t_numerator, -u_numerator
+    if not (0 <= t_numerator <= denominator and 0 <= u_numerator <= denominator):
+        return None
+    x = Fraction(a.x1 * denominator + a.dx * t_numerator, denominator)
+    y = Fraction(a.y1 * denominator + a.dy * t_numerator, denominator)
+    # Целые координаты храним как int, чтобы события совпадали с концами отрезков
+    return (x.numerator if x.denominator == 1 else x,
+            y.numerator if y.denominator == 1 else y)
+
+
+class SegmentSweep:
+    """Заметание прямой (Бентли-Оттманн) для поиска всех пересечений
+
+    Концы отрезков задаются парами ScreenPoint; точки пересечения вычисляются
+    точно в рациональных числах. Для каждой точки пересечения сообщается набор
+    всех проходящих через нее отрезков; наложения коллинеарных отрезков
+    сообщаются в концах общей части.
+
+    Статус заметания - обычный список с двоичным поиском: O((n + k) log n)
+    сравнений, но вставка и удаление сдвигают список, поэтому худший случай
+    O((n + k) m), где m - число отрезков, одновременно пересекающих прямую.
+    Для коротких отрезков m мало, и сдвиги дешевле сбалансированного дерева.
+    """
+
+    def __init__(self, segments: Sequence[Tuple[ScreenPoint, ScreenPoint]]):
+        self.segments = [_Segment(i, start, end) for i, (start, end) in enumerate(segments)]
+
+    def run(self) -> List[SegmentIntersection]:
+        starting: Dict[EventPoint, List[_Segment]] = {}
+        degenerate: Dict[EventPoint, List[_Segment]] = {}
+        queue: List[EventPoint] = []
+        queued = set()
+
+        def push(point: EventPoint) -> None:
+            if point not in queued:
+                queued.add(point)
+                heapq.heappush(queue, point)
+
+        for segment in self.segments:
+            if segment.left == segment.right:
+                degenerate.setdefault(segment.left, []).append(segment)
+            else:
+                starting.setdefault(segment.left, []).append(segment)
+                push(segment.right)
+            push(segment.left)
+
+        status: List[_Segment] = []
+        result: List[SegmentIntersection] = []
+
+        def find_event(below: _Segment, above: _Segment, point: EventPoint) -> None:
+            crossing = _intersection(below, above)
+            if crossing is not None and crossing > point:
+                push(crossing)
+
+        while queue:
+            point = heapq.heappop(queue)
+            px, py = point
+
+            # Общий знаменатель, чтобы сравнения с отрезками шли в целых числах
+            d = lcm(px.denominator, py.denominator)
+            x = px.numerator * (d // px.denominator)
+            y = py.numerator * (d // py.denominator)
+
+            # Отрезки, проходящие через точку события, лежат в статусе подряд
+            lo, hi = 0, len(status)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if status[mid].side_of(x, y, d) < 0:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            hi = lo
+            end = len(status)
+            while hi < end:
+                mid = (hi + end) // 2
+                if status[mid].side_of(x, y, d) > 0:
+                    end = mid
+                else:
+                    hi = mid + 1
+            through = status[lo:hi]
+            containing = [s for s in through if s.right != point]
+            upper = starting.get(point, [])
+
+            involved = upper + through + degenerate.get(point, [])
+            if len(involved) > 1:
+                result.append(SegmentIntersection(px, py, tuple(sorted(s.index for s in involved))))
+
+            inserted = sorted(upper + containing, key=_Segment.slope_key)
+            # Сдвиг хвоста списка: O(m) на событие
+            status[lo:hi] = inserted
+
+            if not inserted:
+                if 0 < lo < len(status):
+                    find_event(status[lo - 1], status[lo], point)
+            else:
+                if lo > 0:
+                    find_event(status[lo - 1], status[lo], point)
+                top = lo + len(inserted) - 1
+                if top + 1 < len(status):
+                    find_event(status[top], status[top + 1], point)
+
+        return result
+
+
+def find_intersections(segments: Sequence[Tuple[ScreenPoint, ScreenPoint]]) -> List[SegmentIntersection]:
+    """Все пересечения набора отрезков методом заметающей прямой"""
+    return SegmentSweep(segments).run()
+
+
+def brute_force_intersections(segments: Sequence[Tuple[ScreenPoint, ScreenPoint]]) -> List[Tuple[int, int]]:
+    """Эталонная проверка всех пар через ScreenVector.cross_product, O(n^2)"""
+    pairs = []
+    for i in range(len(segments)):
+        a_start, a_end = segments[i]
+        a = ScreenVector(start=a_start, end=a_end)
+        for j in range(i + 1, len(segments)):
+            b_start, b_end = segments[j]
+            b = ScreenVector(start=b_start, end=b_end)
+            d1 = a.cross_product(ScreenVector(start=a_start, end=b_start))
+            d2 = a.cross_product(ScreenVector(start=a_start, end=b_end))
+            d3 = b.cross_product(ScreenVector(start=b_start, end=a_start))
+            d4 = b.cross_product(ScreenVector(start=b_start, end=a_end))
+            if ((d1 > 0 and d2 > 0) or (d1 < 0 and d2 < 0)
+                    or (d3 > 0 and d4 > 0) or (d3 < 0 and d4 < 0)):
+                continue
+            if d1 == d2 == d3 == d4 == 0:
+                # Коллинеарные отрезки: пересекаются, если перекрываются проекции
+                if (max(a_start.x, a_end.x) < min(b_start.x, b_end.x)
+                        or max(b_start.x, b_end.x) < min(a_start.x, a_end.x)
+                        or max(a_start.y, a_end.y) < min(b_start.y, b_end.y)
+                        or max(b_start.y, b_end.y) < min(a_start.y, a_end.y)):
+                    continue
+            pairs.append((i, j))
+    return pairs
+
+
+def demonstrate_sweep():
+    """Демонстрация поиска пересечений соединительных линий"""
+    segments = [
+        (ScreenPoint(0, 0), ScreenPoint(100, 100)),
+        (ScreenPoint(0, 100), ScreenPoint(100, 0)),
+        (ScreenPoint(50, 0), ScreenPoint(50, 200)),
+        (ScreenPoint(200, 200), ScreenPoint(300, 300)),
+    ]
+    for crossing in find_intersections(segments):
+        print(f"Пересечение в ({crossing.x}, {crossing.y}): отрезки {crossing.segments}")
+    print(f"Полный перебор: {brute_force_intersections(segments)}")
+
+
+if __name__ == "__main__":
+    demonstrate_sweep()
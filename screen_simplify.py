@@ -0,0 +1,155 @@
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from screen_arrays import ScreenPointArray
+
+Chunk = Union[ScreenPointArray, Iterable[ScreenPoint]]
+
+# Участки не длиннее этого обрабатываются циклом Python, длиннее - numpy
+_SMALL_RANGE = 64
+
+
+def radial_prefilter(points: ScreenPointArray, tolerance: float) -> np.ndarray:
+    """Индексы точек, удаленных от предыдущей оставленной не меньше чем на tolerance"""
+    n = len(points)
+    if n <= 2:
+        return np.arange(n)
+    tolerance_sq = tolerance * tolerance
+    xs = points.x.tolist()
+    ys = points.y.tolist()
+    kept = [0]
+    last_x, last_y = xs[0], ys[0]
+    for i in range(1, n - 1):
+        dx = xs[i] - last_x
+        dy = ys[i] - last_y
+        if dx * dx + dy * dy >= tolerance_sq:
+            kept.append(i)
+            last_x, last_y = xs[i], ys[i]
+    kept.append(n - 1)
+    return np.array(kept, dtype=np.int64)
+
+
+def douglas_peucker(points: ScreenPointArray, epsilon: float) -> np.ndarray:
+    """Индексы точек, оставленных алгоритмом Дугласа-Пекера
+
+    Расстояние до хорды считается через cross(хорда, точка - начало) и
+    сравнивается в квадратах, без sqrt и деления.
+    """
+    n = len(points)
+    if n <= 2:
+        return np.arange(n)
+    x = points.x.astype(np.int64)
+    y = points.y.astype(np.int64)
+    xs = x.tolist()
+    ys = y.tolist()
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[n - 1] = True
+    epsilon_sq = epsilon * epsilon
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x0, y0 = xs[first], ys[first]
+        chord_dx, chord_dy = xs[last] - x0, ys[last] - y0
+        chord_sq = chord_dx * chord_dx + chord_dy * chord_dy
+        # Сравнение cross(хорда, точка - начало)^2 > epsilon^2 * |хорда|^2, как в cross_product
+        threshold = epsilon_sq * chord_sq if chord_sq else epsilon_sq
+
+        if last - first <= _SMALL_RANGE:
+            # Короткие участки дешевле перебрать без numpy
+            best, index = -1, first
+            for i in range(first + 1, last):
+                dx = xs[i] - x0
+                dy = ys[i] - y0
+                if chord_sq:
+                    cross = chord_dx * dy - chord_dy * dx
+                    distance = cross * cross
+                else:
+                    distance = dx * dx + dy * dy
+                if distance > best:
+                    best, index = distance, i
+        else:
+            dx = x[first + 1:last] - x0
+            dy = y[first + 1:last] - y0
+            if chord_sq:
+                cross = chord_dx * dy - chord_dy * dx
+                distance = cross * cross
+            else:
+                # Замкнутый участок: расстояние до начальной точки
+                distance = dx * dx + dy * dy
+            farthest = int(np.argmax(distance))
+            best, index = int(distance[farthest]), first + 1 + farthest
+
+        if best > threshold:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return np.nonzero(keep)[0]
+
+
+def simplify(points: Chunk, epsilon: float, radial_tolerance: float = None) -> ScreenPointArray:
+    """Упрощает ломаную: радиальный префильтр (по умолчанию epsilon), затем Дуглас-Пекер"""
+    if not isinstance(points, ScreenPointArray):
+        points = ScreenPointArray.from_points(points)
+    tolerance = epsilon if radial_tolerance is None else radial_tolerance
+    if tolerance > 0:
+        points = points[radial_prefilter(points, tolerance)]
+    return points[douglas_peucker(points, epsilon)]
+
+
+def _chunks(source: Iterable[Chunk], chunk_size: int) -> Iterator[ScreenPointArray]:
+    """Приводит поток пакетов или отдельных точек к пакетам ScreenPointArray"""
+    iterator = iter(source)
+    for item in iterator:
+        if isinstance(item, ScreenPoint):
+            batch = [item] + list(islice(iterator, chunk_size - 1))
+            yield ScreenPointArray.from_points(batch)
+        elif isinstance(item, ScreenPointArray):
+            yield item
+        else:
+            yield ScreenPointArray.from_points(item)
+
+
+def simplify_stream(source: Iterable[Chunk], epsilon: float, radial_tolerance: float = None,
+                    chunk_size: int = 1 << 16) -> Iterator[ScreenPointArray]:
+    """Потоковое упрощение с ограниченной памятью
+
+    Источник - генератор точек или пакетов. Каждый пакет упрощается
+    отдельно, последняя точка пакета переносится в начало следующего, поэтому
+    ломаная остается непрерывной, а границы пакетов всегда сохраняются.
+    """
+    carry = None
+    for chunk in _chunks(source, chunk_size):
+        if len(chunk) == 0:
+            continue
+        if carry is not None:
+            chunk = ScreenPointArray._from_trusted(np.concatenate((carry.x, chunk.x)),
+                                                   np.concatenate((carry.y, chunk.y)))
+        simplified = simplify(chunk, epsilon, radial_tolerance)
+        carry = chunk[-1:]
+        # Последняя точка будет выдана вместе со следующим пакетом
+        yield simplified[:-1]
+    if carry is not None:
+        yield carry
+
+
+def demonstrate_simplification():
+    """Демонстрация упрощения траектории указателя"""
+    t = np.linspace(0, 4 * np.pi, 2000)
+    radius = 400 * t / (4 * np.pi)
+    trace = ScreenPointArray(np.rint(960 + radius * np.cos(t)).astype(int),
+                             np.rint(540 + radius * np.sin(t)).astype(int))
+    simplified = simplify(trace, epsilon=2.0)
+    print(f"Точек было: {len(trace)}, стало: {len(simplified)}")
+
+    streamed: List[ScreenPointArray] = list(simplify_stream(iter(trace.to_points()), 2.0, chunk_size=500))
+    print(f"Потоковое упрощение: {sum(len(part) for part in streamed)} точек")
+
+
+if __name__ == "__main__":
+    demonstrate_simplification()
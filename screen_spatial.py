@@ -0,0 +1,131 @@
+from typing import Any, Dict, Iterable, List
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+from oop4lab import IObservableProperties, IPropertyObserver
+from screen_observable import ObservableScreenPoint
+
+
+class ScreenGridIndex(IPropertyObserver):
+    """Равномерная сетка над экраном для запросов по прямоугольнику и радиусу"""
+
+    def __init__(self, cell_size: int = 64):
+        if not isinstance(cell_size, int) or cell_size <= 0:
+            raise ValueError("Cell size must be a positive integer")
+        self.cell_size = cell_size
+        self._cols = SCREEN_WIDTH // cell_size + 1
+        self._rows = SCREEN_HEIGHT // cell_size + 1
+        # Ячейка хранит точки по id, т.к. ScreenPoint не хешируется
+        self._cells: List[Dict[int, ScreenPoint]] = [{} for _ in range(self._cols * self._rows)]
+        self._locations: Dict[int, int] = {}
+
+    @classmethod
+    def build(cls, points: Iterable[ScreenPoint], cell_size: int = 64) -> 'ScreenGridIndex':
+        """Массовое построение индекса по набору точек"""
+        index = cls(cell_size)
+        cells = index._cells
+        locations = index._locations
+        for point in points:
+            cell = index._cell_of(point.x, point.y)
+            cells[cell][id(point)] = point
+            locations[id(point)] = cell
+            if isinstance(point, IObservableProperties):
+                point.subscribe_observer(index)
+        return index
+
+    def _cell_of(self, x: int, y: int) -> int:
+        return (y // self.cell_size) * self._cols + x // self.cell_size
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    def __contains__(self, point: ScreenPoint) -> bool:
+        return id(point) in self._locations
+
+    def insert(self, point: ScreenPoint) -> None:
+        """Добавляет точку; наблюдаемые точки подписывают индекс на свои изменения"""
+        if id(point) in self._locations:
+            return
+        cell = self._cell_of(point.x, point.y)
+        self._cells[cell][id(point)] = point
+        self._locations[id(point)] = cell
+        if isinstance(point, IObservableProperties):
+            point.subscribe_observer(self)
+
+    def remove(self, point: ScreenPoint) -> None:
+        """Удаляет точку из индекса"""
+        cell = self._locations.pop(id(point), None)
+        if cell is None:
+            raise KeyError(f"{point!r} is not in the index")
+        del self._cells[cell][id(point)]
+        if isinstance(point, IObservableProperties):
+            point.unsubscribe_observer(self)
+
+    # Реализация интерфейса IPropertyObserver
+    def property_updated(self, source: Any, prop_name: str) -> None:
+        """Переносит точку в новую ячейку после срабатывания сеттера x/y"""
+        old_cell = self._locations.get(id(source))
+        if old_cell is None:
+            return
+        new_cell = self._cell_of(source.x, source.y)
+        if new_cell != old_cell:
+            del self._cells[old_cell][id(source)]
+            self._cells[new_cell][id(source)] = source
+            self._locations[id(source)] = new_cell
+
+    def update(self, point: ScreenPoint) -> None:
+        """Явное обновление для обычных (не наблюдаемых) точек после изменения координат"""
+        self.property_updated(point, "xy")
+
+    def query_rect(self, x_min: int, y_min: int, x_max: int, y_max: int) -> List[ScreenPoint]:
+        """Точки внутри прямоугольника (границы включительно)"""
+        x_min, y_min = max(x_min, 0), max(y_min, 0)
+        x_max, y_max = min(x_max, SCREEN_WIDTH), min(y_max, SCREEN_HEIGHT)
+        if x_min > x_max or y_min > y_max:
+            return []
+
+        size = self.cell_size
+        cx_min, cx_max = x_min // size, x_max // size
+        cy_min, cy_max = y_min // size, y_max // size
+        result = []
+        for cy in range(cy_min, cy_max + 1):
+            row_inside = y_min <= cy * size and (cy + 1) * size - 1 <= y_max
+            for cx in range(cx_min, cx_max + 1):
+                cell = self._cells[cy * self._cols + cx]
+                if not cell:
+                    continue
+                # Ячейки, целиком лежащие в прямоугольнике, не фильтруются
+                if row_inside and x_min <= cx * size and (cx + 1) * size - 1 <= x_max:
+                    result.extend(cell.values())
+                else:
+                    result.extend(p for p in cell.values()
+                                  if x_min <= p.x <= x_max and y_min <= p.y <= y_max)
+        return result
+
+    def query_radius(self, center: ScreenPoint, radius: float) -> List[ScreenPoint]:
+        """Точки на расстоянии не больше radius от center"""
+        if radius < 0:
+            raise ValueError("Radius must be non-negative")
+        cx, cy = center.x, center.y
+        reach = int(radius)
+        radius_sq = radius * radius
+        candidates = self.query_rect(cx - reach, cy - reach, cx + reach, cy + reach)
+        return [p for p in candidates if (p.x - cx) ** 2 + (p.y - cy) ** 2 <= radius_sq]
+
+
+def demonstrate_spatial_index():
+    """Демонстрация пространственного индекса"""
+    points = [ObservableScreenPoint(x, y) for x in range(0, 1920, 40) for y in range(0, 1080, 40)]
+    index = ScreenGridIndex.build(points)
+    print(f"Точек в индексе: {len(index)}")
+    print(f"В прямоугольнике (100, 100)-(200, 200): {len(index.query_rect(100, 100, 200, 200))}")
+
+    cursor = ScreenPoint(960, 540)
+    print(f"В радиусе 50 от {cursor}: {index.query_radius(cursor, 50)}")
+
+    points[0].x = 955
+    points[0].y = 545
+    print(f"После перемещения {points[0]}: {index.query_radius(cursor, 10)}")
+
+
+if __name__ == "__main__":
+    demonstrate_spatial_index()
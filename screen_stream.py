@@ -0,0 +1,272 @@
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT, ScreenPoint
+from screen_arrays import ScreenPointArray
+from screen_simplify import simplify_stream
+from screen_transform import AffineTransform, BoundsMode
+
+# Элемент источника: точка, пара координат (возможно за пределами экрана) или готовый пакет
+SourceItem = Union[ScreenPoint, Tuple[int, int], ScreenPointArray]
+Coordinates = Tuple[np.ndarray, np.ndarray]
+
+
+class _ElementwiseOp(ABC):
+    """Поэлементная операция над столбцами координат; соседние такие операции сливаются"""
+    name = 'op'
+    # Гарантирует ли операция, что все координаты уже на экране
+    bounded = False
+
+    @abstractmethod
+    def apply(self, x: np.ndarray, y: np.ndarray) -> Coordinates:
+        pass
+
+
+class _AffineOp(_ElementwiseOp):
+    name = 'transform'
+
+    def __init__(self, transform: AffineTransform):
+        self.transform = transform
+
+    def apply(self, x: np.ndarray, y: np.ndarray) -> Coordinates:
+        (a, b, tx), (c, d, ty) = self.transform.matrix
+        # Целочисленный сдвиг - самый частый случай, считаем его без перехода к float
+        if (a, b, c, d) == (1, 0, 0, 1) and float(tx).is_integer() and float(ty).is_integer():
+            return x + int(tx), y + int(ty)
+        return self.transform.apply_xy(x, y)
+
+
+class _BoundsOp(_ElementwiseOp):
+    def __init__(self, mode: BoundsMode):
+        self.mode = mode
+        self.name = mode.value
+        self.bounded = True
+
+    def apply(self, x: np.ndarray, y: np.ndarray) -> Coordinates:
+        if self.mode is BoundsMode.CLAMP:
+            return np.clip(x, 0, SCREEN_WIDTH), np.clip(y, 0, SCREEN_HEIGHT)
+        if self.mode is BoundsMode.CLIP:
+            visible = (x >= 0) & (x <= SCREEN_WIDTH) & (y >= 0) & (y <= SCREEN_HEIGHT)
+            return x[visible], y[visible]
+        return (ScreenPointArray._validate_coordinates(x, SCREEN_WIDTH, 'x'),
+                ScreenPointArray._validate_coordinates(y, SCREEN_HEIGHT, 'y'))
+
+
+class _FilterOp(_ElementwiseOp):
+    name = 'filter'
+
+    def __init__(self, predicate: Callable[[np.ndarray, np.ndarray], np.ndarray]):
+        self.predicate = predicate
+
+    def apply(self, x: np.ndarray, y: np.ndarray) -> Coordinates:
+        keep = np.asarray(self.predicate(x, y), dtype=bool)
+        return x[keep], y[keep]
+
+
+def _fuse(ops: List[_ElementwiseOp]) -> List[_ElementwiseOp]:
+    """Склеивает подряд идущие аффинные преобразования в одну матрицу"""
+    fused: List[_ElementwiseOp] = []
+    for op in ops:
+        if isinstance(op, _AffineOp) and fused and isinstance(fused[-1], _AffineOp):
+            fused[-1] = _AffineOp(fused[-1].transform.then(op.transform))
+        else:
+            fused.append(op)
+    return fused
+
+
+def _run_fused(stream: Iterator[Union[Coordinates, ScreenPointArray]],
+               ops: List[_ElementwiseOp]) -> Iterator[ScreenPointArray]:
+    """Один проход по каждому пакету для всей группы поэлементных операций"""
+    trusted = bool(ops) and ops[-1].bounded
+    for chunk in stream:
+        x, y = (chunk.x, chunk.y) if isinstance(chunk, ScreenPointArray) else chunk
+        for op in ops:
+            # Проверки границ и фильтры работают с пикселями, а не с дробными координатами
+            if not isinstance(op, _AffineOp) and x.dtype.kind == 'f':
+                x, y = np.rint(x).astype(np.int64), np.rint(y).astype(np.int64)
+            x, y = op.apply(x, y)
+        if x.dtype.kind == 'f':
+            x, y = np.rint(x).astype(np.int64), np.rint(y).astype(np.int64)
+        if len(x) == 0:
+            continue
+        if trusted:
+            yield ScreenPointArray._from_trusted(x.astype(np.int32, copy=False), y.astype(np.int32, copy=False))
+        else:
+            yield ScreenPointArray(x, y)
+
+
+def _raw_chunks(source: Iterable[SourceItem], chunk_size: int) -> Iterator[Union[Coordinates, ScreenPointArray]]:
+    """Нарезает источник на пакеты столбцов без создания промежуточных объектов"""
+    iterator = iter(source)
+    for item in iterator:
+        if isinstance(item, ScreenPointArray):
+            # Крупный пакет режется на части, иначе память не ограничена chunk_size
+            for start in range(0, len(item), chunk_size):
+                yield item[start:start + chunk_size]
+            continue
+        batch = [item] + list(islice(iterator, chunk_size - 1))
+        if isinstance(item, ScreenPoint):
+            yield (np.fromiter((p.x for p in batch), dtype=np.int64, count=len(batch)),
+                   np.fromiter((p.y for p in batch), dtype=np.int64, count=len(batch)))
+        else:
+            pairs = np.array(batch, dtype=np.int64).reshape(-1, 2)
+            yield pairs[:, 0], pairs[:, 1]
+
+
+def _dedupe(stream: Iterator[ScreenPointArray]) -> Iterator[ScreenPointArray]:
+    """Убирает подряд идущие повторы, в том числе на стыке пакетов"""
+    last = None
+    for chunk in stream:
+        x, y = chunk.x, chunk.y
+        keep = np.ones(len(chunk), dtype=bool)
+        keep[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+        if last is not None:
+            keep[0] = (int(x[0]), int(y[0])) != last
+        last = (int(x[-1]), int(y[-1]))
+        if keep.all():
+            yield chunk
+        elif keep.any():
+            yield chunk[keep]
+
+
+class PointStream:
+    """Ленивый конвейер над потоком точек
+
+    Стадии только описывают обработку; данные идут пакетами по chunk_size
+    точек при итерации, поэтому память ограничена размером пакета.
+    Соседние поэлементные стадии (transform/translate, clip, clamp, filter)
+    выполняются одним проходом по пакету, а подряд идущие аффинные
+    преобразования перемножаются в одну матрицу. Каждая стадия возвращает
+    новый поток, исходный не меняется.
+    """
+
+    def __init__(self, source: Iterable[SourceItem], chunk_size: int = 1 << 16):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        self._source = source
+        self.chunk_size = chunk_size
+        self._stages: Tuple = ()
+
+    def _then(self, stage) -> 'PointStream':
+        stream = PointStream(self._source, self.chunk_size)
+        stream._stages = self._stages + (stage,)
+        return stream
+
+    # Поэлементные стадии
+    def transform(self, transform: AffineTransform) -> 'PointStream':
+        return self._then(_AffineOp(transform))
+
+    def translate(self, dx: float, dy: float) -> 'PointStream':
+        return self._then(_AffineOp(AffineTransform.translation(dx, dy)))
+
+    def clamp(self) -> 'PointStream':
+        return self._then(_BoundsOp(BoundsMode.CLAMP))
+
+    def clip(self) -> 'PointStream':
+        return self._then(_BoundsOp(BoundsMode.CLIP))
+
+    def validate(self) -> 'PointStream':
+        return self._then(_BoundsOp(BoundsMode.VALIDATE))
+
+    def filter(self, predicate: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> 'PointStream':
+        """predicate получает столбцы x, y пакета и возвращает булеву маску"""
+        return self._then(_FilterOp(predicate))
+
+    # Стадии с состоянием между пакетами
+    def dedupe(self) -> 'PointStream':
+        """Убирает подряд идущие одинаковые точки"""
+        return self._then(('dedupe', _dedupe))
+
+    def simplify(self, epsilon: float, radial_tolerance: Optional[float] = None) -> 'PointStream':
+        """Упрощение ломаной потоком (см. screen_simplify.simplify_stream)"""
+        def run(stream: Iterator[ScreenPointArray]) -> Iterator[ScreenPointArray]:
+            for chunk in simplify_stream(stream, epsilon, radial_tolerance, self.chunk_size):
+                if len(chunk):
+                    yield chunk
+        return self._then(('simplify', run))
+
+    def _plan(self) -> List[Tuple[str, object]]:
+        """Стадии после слияния: ('fused', [операции]) или (имя, функция над потоком)"""
+        plan, group = [], []
+        # Пока идут сырые координаты источника, перед любой стадией нужна проверка границ
+        raw = True
+        for stage in self._stages + (None,):
+            if isinstance(stage, _ElementwiseOp):
+                group.append(stage)
+                continue
+            if group or raw:
+                plan.append(('fused', _fuse(group)))
+            group, raw = [], False
+            if stage is not None:
+                plan.append(stage)
+        return plan
+
+    def describe(self) -> str:
+        """Текстовое описание плана выполнения после слияния стадий"""
+        steps = ['source']
+        for name, body in self._plan():
+            if name == 'fused':
+                steps.append('[' + '+'.join(op.name for op in body) + ']' if body else '[validate]')
+            else:
+                steps.append(name)
+        return ' -> '.join(steps)
+
+    # Выполнение
+    def chunks(self) -> Iterator[ScreenPointArray]:
+        stream = _raw_chunks(self._source, self.chunk_size)
+        for name, body in self._plan():
+            stream = _run_fused(stream, body) if name == 'fused' else body(stream)
+        return stream
+
+    def __iter__(self) -> Iterator[ScreenPoint]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def collect(self) -> ScreenPointArray:
+        """Собирает весь поток в один массив (только для конечных источников)"""
+        parts = list(self.chunks())
+        if not parts:
+            return ScreenPointArray([], [])
+        return ScreenPointArray._from_trusted(np.concatenate([p.x for p in parts]),
+                                              np.concatenate([p.y for p in parts]))
+
+    def emit(self, sink: Callable[[ScreenPointArray], None]) -> int:
+        """Передает пакеты в sink по мере готовности; возвращает число выданных точек"""
+        total = 0
+        for chunk in self.chunks():
+            sink(chunk)
+            total += len(chunk)
+        return total
+
+    def __repr__(self) -> str:
+        return f"PointStream({self.describe()})"
+
+
+def demonstrate_point_stream():
+    """Демонстрация ленивого конвейера над бесконечным потоком координат"""
+    def sensor():
+        # Бесконечный дрожащий след курсора, часть точек уходит за экран
+        rng = np.random.default_rng(0)
+        x, y = 900, 500
+        while True:
+            x += int(rng.integers(-3, 4))
+            y += int(rng.integers(-2, 3))
+            yield (x, y)
+
+    pipeline = (PointStream(islice(sensor(), 500_000), chunk_size=4096)
+                .translate(100, -50)
+                .transform(AffineTransform.scaling(1.5))
+                .clip()
+                .dedupe()
+                .simplify(2.0))
+    print(f"План: {pipeline.describe()}")
+    batches = []
+    emitted = pipeline.emit(lambda chunk: batches.append(len(chunk)))
+    print(f"Выдано точек: {emitted} из 500000, пакетов: {len(batches)}, крупнейший: {max(batches)}")
+
+
+if __name__ == "__main__":
+    demonstrate_point_stream()
@@ -0,0 +1,248 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from oop1laba import SCREEN_WIDTH, SCREEN_HEIGHT
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+from screen_clipping import _liang_barsky
+from screen_raster import Framebuffer, line_pixels
+from screen_rect import ScreenRect
+
+
+class PoolKind(Enum):
+    THREAD = 'thread'
+    PROCESS = 'process'
+
+
+@dataclass
+class TileBins:
+    """Раскладка объектов по плиткам в формате CSR
+
+    Объекты плитки t - indices[offsets[t]:offsets[t + 1]], по возрастанию номера.
+    Объект, пересекающий границу, попадает во все задетые плитки.
+    """
+    indices: np.ndarray
+    offsets: np.ndarray
+
+    def objects(self, tile: int) -> np.ndarray:
+        return self.indices[self.offsets[tile]:self.offsets[tile + 1]]
+
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def duplication(self) -> float:
+        """Среднее число плиток на объект (1.0 - никто не пересекает границы)"""
+        unique = len(np.unique(self.indices))
+        return len(self.indices) / unique if unique else 1.0
+
+
+class TileGrid:
+    """Разбиение экрана на плитки tile_width x tile_height (последние могут быть уже)"""
+
+    def __init__(self, tile_width: int = 256, tile_height: int = 256):
+        if tile_width < 1 or tile_height < 1:
+            raise ValueError("Tile size must be positive")
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.columns = -(-(SCREEN_WIDTH + 1) // tile_width)
+        self.rows = -(-(SCREEN_HEIGHT + 1) // tile_height)
+
+    def __len__(self) -> int:
+        return self.columns * self.rows
+
+    def tile_rect(self, tile: int) -> ScreenRect:
+        row, column = divmod(tile, self.columns)
+        x_min, y_min = column * self.tile_width, row * self.tile_height
+        return ScreenRect(x_min, y_min, min(x_min + self.tile_width - 1, SCREEN_WIDTH),
+                          min(y_min + self.tile_height - 1, SCREEN_HEIGHT))
+
+    def tile_of(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Номера плиток для точек экрана"""
+        return (np.asarray(y) // self.tile_height) * self.columns + np.asarray(x) // self.tile_width
+
+    def _bins(self, objects: np.ndarray, tiles: np.ndarray) -> TileBins:
+        order = np.lexsort((objects, tiles))
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tiles, minlength=len(self)), out=offsets[1:])
+        return TileBins(objects[order], offsets)
+
+    def _box_pairs(self, x_min, y_min, x_max, y_max) -> Tuple[np.ndarray, np.ndarray]:
+        """Пары (объект, плитка) для всех плиток, задетых ограничивающими прямоугольниками"""
+        c0 = np.clip(np.floor(np.asarray(x_min) / self.tile_width), 0, self.columns - 1).astype(np.int64)
+        c1 = np.clip(np.floor(np.asarray(x_max) / self.tile_width), 0, self.columns - 1).astype(np.int64)
+        r0 = np.clip(np.floor(np.asarray(y_min) / self.tile_height), 0, self.rows - 1).astype(np.int64)
+        r1 = np.clip(np.floor(np.asarray(y_max) / self.tile_height), 0, self.rows - 1).astype(np.int64)
+        widths = c1 - c0 + 1
+        counts = widths * (r1 - r0 + 1)
+        objects = np.repeat(np.arange(len(counts)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = r0[objects] + local // widths[objects]
+        columns = c0[objects] + local % widths[objects]
+        return objects, rows * self.columns + columns
+
+    def bin_points(self, points: ScreenPointArray) -> TileBins:
+        """Каждая точка попадает ровно в одну плитку"""
+        return self._bins(np.arange(len(points)), self.tile_of(points.x.astype(np.int64), points.y.astype(np.int64)))
+
+    def bin_rects(self, rects: Sequence[ScreenRect]) -> TileBins:
+        boxes = np.array([(r.x_min, r.y_min, r.x_max, r.y_max) for r in rects], dtype=np.int64).reshape(-1, 4)
+        return self._bins(*self._box_pairs(*boxes.T))
+
+    def bin_segments(self, starts: ScreenPointArray, vectors: ScreenVectorArray, margin: float = 0.5) -> TileBins:
+        """Отрезок попадает во все плитки, которые он действительно пересекает
+
+        Плитки расширяются на margin пикселя: растеризованный пиксель может
+        отстоять от точной линии на половину пикселя.
+        """
+        x0 = starts.x.astype(np.float64)
+        y0 = starts.y.astype(np.float64)
+        dx = vectors.dx.astype(np.float64)
+        dy = vectors.dy.astype(np.float64)
+        x1, y1 = x0 + dx, y0 + dy
+        objects, tiles = self._box_pairs(np.minimum(x0, x1) - margin, np.minimum(y0, y1) - margin,
+                                         np.maximum(x0, x1) + margin, np.maximum(y0, y1) + margin)
+        # Кандидаты по ограничивающему прямоугольнику уточняются Лиангом-Барски
+        row, column = np.divmod(tiles, self.columns)
+        left = column * self.tile_width - margin
+        right = np.minimum(left + self.tile_width - 1, SCREEN_WIDTH) + 2 * margin
+        bottom = row * self.tile_height - margin
+        top = np.minimum(bottom + self.tile_height - 1, SCREEN_HEIGHT) + 2 * margin
+        *_, hit = _liang_barsky(x0[objects], y0[objects], dx[objects], dy[objects], left, bottom, right, top)
+        return self._bins(objects[hit], tiles[hit])
+
+
+# Задача плитки: (номер плитки, ее прямоугольник, данные плитки) -> результат
+TileJob = Callable[[int, ScreenRect, Any], Any]
+
+
+class TileScheduler:
+    """Выполняет задачи плиток в пуле потоков или процессов
+
+    Результаты возвращаются по возрастанию номера плитки независимо от того,
+    в каком порядке задачи завершились, поэтому слияние детерминировано.
+    Для пула процессов задача должна быть функцией верхнего уровня модуля;
+    каждой плитке передаются только ее собственные данные.
+    """
+
+    def __init__(self, grid: TileGrid = None, pool: Union[PoolKind, str] = PoolKind.THREAD,
+                 workers: Optional[int] = None):
+        self.grid = grid or TileGrid()
+        self.pool = PoolKind(pool)
+        self.workers = workers or os.cpu_count() or 1
+
+    def _executor(self) -> Executor:
+        if self.pool is PoolKind.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def run(self, job: TileJob, bins: TileBins,
+            payload: Callable[[np.ndarray], Any]) -> List[Tuple[int, Any]]:
+        """Запускает job для каждой непустой плитки; payload вырезает данные по индексам объектов"""
+        tiles = [tile for tile in range(len(self.grid)) if bins.offsets[tile + 1] > bins.offsets[tile]]
+        with self._executor() as executor:
+            futures = [executor.submit(job, tile, self.grid.tile_rect(tile), payload(bins.objects(tile)))
+                       for tile in tiles]
+            return [(tile, future.result()) for tile, future in zip(tiles, futures)]
+
+
+# Готовые задачи плиток
+def _raster_tile(tile: int, rect: ScreenRect, data: Tuple[ScreenPointArray, ScreenVectorArray]) -> np.ndarray:
+    """Маска закрашенных пикселей плитки (значение пишет вызывающий, поэтому работает и value=0)"""
+    starts, vectors = data
+    x, y, _ = line_pixels(starts, vectors)
+    covered = np.zeros((rect.height + 1, rect.width + 1), dtype=bool)
+    # Отрезок на границе рисуется в каждой плитке целиком, но пишется только своя часть
+    inside = (x >= rect.x_min) & (x <= rect.x_max) & (y >= rect.y_min) & (y <= rect.y_max)
+    covered[y[inside] - rect.y_min, x[inside] - rect.x_min] = True
+    return covered
+
+
+# Данные плитки для проверки попаданий: (номера точек, x, y), (номера прямоугольников, их границы)
+HitTileData = Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+# Сколько элементов матрицы "точки x прямоугольники" строится за один шаг
+HIT_TEST_BLOCK = 1 << 22
+
+
+def _hit_tile(tile: int, rect: ScreenRect, data: HitTileData) -> np.ndarray:
+    """Пары (точка, прямоугольник) плитки; матрица попаданий строится блоками точек"""
+    (point_ids, px, py), (rect_ids, boxes) = data
+    step = max(1, HIT_TEST_BLOCK // max(len(boxes), 1))
+    pairs = [np.zeros((0, 2), dtype=np.int64)]
+    for start in range(0, len(point_ids), step):
+        x = px[start:start + step, None]
+        y = py[start:start + step, None]
+        inside = ((x >= boxes[None, :, 0]) & (x <= boxes[None, :, 2])
+                  & (y >= boxes[None, :, 1]) & (y <= boxes[None, :, 3]))
+        hit_points, hit_rects = np.nonzero(inside)
+        pairs.append(np.column_stack((point_ids[start + hit_points], rect_ids[hit_rects])))
+    return np.concatenate(pairs)
+
+
+def tiled_rasterize(scheduler: TileScheduler, frame: Framebuffer, starts: ScreenPointArray,
+                    vectors: ScreenVectorArray, value: int = 255) -> None:
+    """Рисует отрезки по плиткам; результат совпадает с frame.draw_lines"""
+    bins = scheduler.grid.bin_segments(starts, vectors)
+    results = scheduler.run(_raster_tile, bins, lambda ids: (starts[ids], vectors[ids]))
+    for tile, covered in results:
+        rect = scheduler.grid.tile_rect(tile)
+        frame.pixels[rect.y_min:rect.y_max + 1, rect.x_min:rect.x_max + 1][covered] = value
+
+
+def tiled_hit_test(scheduler: TileScheduler, points: ScreenPointArray, rects: Sequence[ScreenRect]) -> np.ndarray:
+    """Пары (индекс точки, индекс прямоугольника), где точка внутри прямоугольника
+
+    Точка лежит ровно в одной плитке, поэтому пары не дублируются, хотя
+    прямоугольники на границах попадают в несколько плиток.
+    """
+    grid = scheduler.grid
+    point_bins = grid.bin_points(points)
+    rect_bins = grid.bin_rects(rects)
+    boxes = np.array([(r.x_min, r.y_min, r.x_max, r.y_max) for r in rects], dtype=np.int64).reshape(-1, 4)
+    x, y = points.x.astype(np.int64), points.y.astype(np.int64)
+
+    def payload(point_ids: np.ndarray) -> tuple:
+        tile = int(grid.tile_of(x[point_ids[0]], y[point_ids[0]]))
+        rect_ids = rect_bins.objects(tile)
+        return (point_ids, x[point_ids], y[point_ids]), (rect_ids, boxes[rect_ids])
+
+    results = [pairs for _, pairs in scheduler.run(_hit_tile, point_bins, payload)]
+    if not results:
+        return np.zeros((0, 2), dtype=np.int64)
+    pairs = np.concatenate(results)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def demonstrate_tiling():
+    """Демонстрация параллельной обработки по плиткам"""
+    rng = np.random.default_rng(0)
+    count = 5000
+    starts = ScreenPointArray(rng.integers(0, 1921, count), rng.integers(0, 1081, count))
+    ends = ScreenPointArray.clamped(starts.x + rng.integers(-200, 201, count),
+                                    starts.y + rng.integers(-200, 201, count))
+    vectors = ScreenVectorArray.between(starts, ends)
+
+    grid = TileGrid(256, 256)
+    bins = grid.bin_segments(starts, vectors)
+    print(f"Плиток: {len(grid)} ({grid.columns}x{grid.rows}), отрезок в среднем в {bins.duplication:.2f} плитках")
+
+    serial = Framebuffer()
+    serial.draw_lines(starts, vectors)
+    for pool in PoolKind:
+        frame = Framebuffer()
+        tiled_rasterize(TileScheduler(grid, pool, workers=4), frame, starts, vectors)
+        print(f"Растеризация ({pool.value}): совпадает с последовательной - {np.array_equal(frame.pixels, serial.pixels)}")
+
+    corners = rng.integers(0, [1800, 1000], size=(2000, 2))
+    rects = [ScreenRect(int(x), int(y), int(x) + 100, int(y) + 60) for x, y in corners]
+    pairs = tiled_hit_test(TileScheduler(grid), starts, rects)
+    print(f"Попаданий точек в прямоугольники: {len(pairs)}")
+
+
+if __name__ == "__main__":
+    demonstrate_tiling()
@@ -0,0 +1,139 @@
+from enum import Enum
+from math import cos, sin, radians
+from typing import Tuple, Union
+
+import numpy as np
+
+from oop1laba import ScreenPoint
+from screen_arrays import ScreenPointArray, ScreenVectorArray
+
+
+class BoundsMode(Enum):
+    VALIDATE = 'validate'  # ValueError, если точка ушла за экран
+    CLAMP = 'clamp'        # прижать к границе экрана
+    CLIP = 'clip'          # отбросить точки вне экрана
+
+
+class AffineTransform:
+    """Аффинное преобразование плоскости, матрица 2x3 [[a, b, tx], [c, d, ty]]
+
+    Цепочка translate/scale/rotate/shear только перемножает матрицы 3x3,
+    поэтому любая цепочка применяется к точкам за один проход.
+    """
+
+    def __init__(self, matrix: Union[np.ndarray, Tuple[Tuple[float, ...], ...]] = None):
+        if matrix is None:
+            matrix = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+        matrix = np.array(matrix, dtype=np.float64)
+        if matrix.shape != (2, 3):
+            raise ValueError("Affine matrix must have shape (2, 3)")
+        self._matrix = matrix
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._matrix.copy()
+
+    def _homogeneous(self) -> np.ndarray:
+        return np.vstack((self._matrix, (0.0, 0.0, 1.0)))
+
+    # Базовые преобразования
+    @classmethod
+    def identity(cls) -> 'AffineTransform':
+        return cls()
+
+    @classmethod
+    def translation(cls, tx: float, ty: float) -> 'AffineTransform':
+        return cls(((1.0, 0.0, tx), (0.0, 1.0, ty)))
+
+    @classmethod
+    def scaling(cls, sx: float, sy: float = None) -> 'AffineTransform':
+        return cls(((sx, 0.0, 0.0), (0.0, sx if sy is None else sy, 0.0)))
+
+    @classmethod
+    def rotation(cls, degrees: float) -> 'AffineTransform':
+        angle = radians(degrees)
+        return cls(((cos(angle), -sin(angle), 0.0), (sin(angle), cos(angle), 0.0)))
+
+    @classmethod
+    def shearing(cls, kx: float, ky: float = 0.0) -> 'AffineTransform':
+        return cls(((1.0, kx, 0.0), (ky, 1.0, 0.0)))
+
+    # Композиция
+    def __matmul__(self, other: 'AffineTransform') -> 'AffineTransform':
+        """self @ other: сначала other, затем self"""
+        if not isinstance(other, AffineTransform):
+            raise TypeError("Can only compose AffineTransform with another AffineTransform")
+        return AffineTransform((self._homogeneous() @ other._homogeneous())[:2])
+
+    def then(self, other: 'AffineTransform') -> 'AffineTransform':
+        """Преобразование, применяющее сначала self, затем other"""
+        return other @ self
+
+    def translate(self, tx: float, ty: float) -> 'AffineTransform':
+        return self.then(AffineTransform.translation(tx, ty))
+
+    def scale(self, sx: float, sy: float = None, center: ScreenPoint = None) -> 'AffineTransform':
+        return self.then(self._around(AffineTransform.scaling(sx, sy), center))
+
+    def rotate(self, degrees: float, center: ScreenPoint = None) -> 'AffineTransform':
+        return self.then(self._around(AffineTransform.rotation(degrees), center))
+
+    def shear(self, kx: float, ky: float = 0.0, center: ScreenPoint = None) -> 'AffineTransform':
+        return self.then(self._around(AffineTransform.shearing(kx, ky), center))
+
+    @staticmethod
+    def _around(transform: 'AffineTransform', center: ScreenPoint = None) -> 'AffineTransform':
+        """Переносит неподвижную точку преобразования в center"""
+        if center is None:
+            return transform
+        return (AffineTransform.translation(center.x, center.y) @ transform
+                @ AffineTransform.translation(-center.x, -center.y))
+
+    def inverse(self) -> 'AffineTransform':
+        return AffineTransform(np.linalg.inv(self._homogeneous())[:2])
+
+    # Применение к пакетам
+    def apply_xy(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Преобразует координаты без округления и проверки границ"""
+        (a, b, tx), (c, d, ty) = self._matrix
+        return a * x + b * y + tx, c * x + d * y + ty
+
+    def apply(self, points: ScreenPointArray,
+              bounds: Union[BoundsMode, str] = BoundsMode.VALIDATE) -> ScreenPointArray:
+        """Преобразует массив точек за один векторный проход с округлением до пикселя"""
+        x, y = self.apply_xy(points.x, points.y)
+        x = np.rint(x).astype(np.int64)
+        y = np.rint(y).astype(np.int64)
+        bounds = BoundsMode(bounds)
+        if bounds is BoundsMode.CLAMP:
+            return ScreenPointArray.clamped(x, y)
+        if bounds is BoundsMode.CLIP:
+            return ScreenPointArray.clipped(x, y)
+        return ScreenPointArray(x, y)
+
+    def apply_vectors(self, vectors: ScreenVectorArray) -> ScreenVectorArray:
+        """Преобразует векторы линейной частью (перенос на векторы не действует)"""
+        (a, b, _), (c, d, _) = self._matrix
+        return ScreenVectorArray(a * vectors.dx + b * vectors.dy, c * vectors.dx + d * vectors.dy)
+
+    def __call__(self, point: ScreenPoint) -> ScreenPoint:
+        x, y = self.apply_xy(point.x, point.y)
+        return ScreenPoint(int(round(x)), int(round(y)))
+
+    def __repr__(self) -> str:
+        return f"AffineTransform({self._matrix.tolist()})"
+
+
+def demonstrate_transforms():
+    """Демонстрация пакетных аффинных преобразований"""
+    cloud = ScreenPointArray([900, 950, 1500], [500, 540, 580])
+    center = ScreenPoint(960, 540)
+    transform = AffineTransform().translate(50, 0).rotate(90, center=center).scale(2, center=center)
+    print(f"Матрица: {transform}")
+    print(f"Результат: {transform.apply(cloud, BoundsMode.CLAMP).to_points()}")
+    print(f"Только видимые: {transform.apply(cloud, BoundsMode.CLIP).to_points()}")
+    print(f"Обратное преобразование точки: {transform.inverse()(transform(ScreenPoint(960, 600)))}")
+
+
+if __name__ == "__main__":
+    demonstrate_transforms()